@@ -1,15 +1,15 @@
 """API route handlers"""
 
-import json
 import logging
 import os
 import uuid
 from datetime import datetime
 from typing import Annotated
 
-from fastapi import APIRouter, HTTPException, Depends
+import orjson
+from fastapi import APIRouter, HTTPException, Depends, Query, Request, Response
 from fastapi.security import APIKeyHeader
-from app.core.utils import get_version
+from app.core.utils import get_version, make_etag
 from app.core.config import API_KEY
 from app.core.dependencies import job_manager
 from app.models.result_models import (
@@ -41,7 +41,7 @@ async def verify_api_key(key: Annotated[str, Depends(header_scheme)]) -> str:
     tags=["health"],
     operation_id="health_check",
 )
-async def health_check():
+async def health_check(request: Request, response: Response):
     """Health check endpoint"""
     try:
         if not job_manager.ping():
@@ -53,7 +53,7 @@ async def health_check():
         completed_jobs = len([j for j in all_jobs if j.status == "completed"])
         failed_jobs = len([j for j in all_jobs if j.status == "failed"])
 
-        return {
+        health = {
             "version": get_version(),
             "status": "healthy",
             "timestamp": datetime.now().isoformat(),
@@ -66,7 +66,7 @@ async def health_check():
         }
     except Exception as e:
         logger.error(f"Health check failed: {str(e)}")
-        return {
+        health = {
             "version": get_version(),
             "status": "unhealthy",
             "timestamp": datetime.now().isoformat(),
@@ -74,6 +74,16 @@ async def health_check():
             "job_stats": {"queued": 0, "processing": 0, "completed": 0, "failed": 0},
         }
 
+    # The timestamp is left out so repeated polls of an unchanged state match.
+    # The checks above run either way: a match only saves the response body.
+    etag = make_etag(
+        orjson.dumps([health["version"], health["status"], health["job_stats"]])
+    )
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=304, headers={"ETag": etag})
+    response.headers["ETag"] = etag
+    return health
+
 
 @router.post(
     "/job/create",
@@ -121,7 +131,7 @@ async def create_job(
             callback_url=body.callback_url,
             params=body.params.model_dump(),
         )
-        job.status = "queued"
+        job.set_status("queued")
         job.start_time = datetime.now()
 
         job_manager.enqueue_job(job)
@@ -148,6 +158,60 @@ async def create_job(
         raise HTTPException(status_code=500, detail=f"Internal server error: {str(e)}")
 
 
+def _job_status_response(job: JobStatus, queued: list[dict]) -> dict:
+    """Build the JobStatusResponse payload, using queued for queue position."""
+    queue_position = 0
+    estimated_wait_time = "00:00:00"
+
+    if job.status == "queued":
+        match = next((q for q in queued if q["job_id"] == job.job_id), None)
+        if match:
+            queue_position = match["queue_position"]
+            estimated_wait_time = match["estimated_wait_time"]
+
+    return {
+        "job_id": job.job_id,
+        "external_id": job.external_id,
+        "job_type": job.job_type,
+        "status": job.status,
+        "progress": job.progress,
+        "queue_position": queue_position,
+        "estimated_wait_time": estimated_wait_time,
+        "start_time": job.start_time.isoformat() if job.start_time else None,
+        "end_time": job.end_time.isoformat() if job.end_time else None,
+        "error_message": job.error_message,
+    }
+
+
+@router.get(
+    "/status",
+    operation_id="get_jobs_status",
+    response_model=list[JobStatusResponse],
+    summary="Get the status of several jobs",
+    tags=["status"],
+)
+async def get_jobs_status(
+    _key: Annotated[str, Depends(verify_api_key)],
+    ids: str = Query(min_length=1, description="Comma-separated job ids"),
+):
+    """Get the status of several jobs at once; unknown job ids are omitted"""
+    try:
+        job_ids = [job_id for job_id in ids.split(",") if job_id]
+        jobs = job_manager.get_jobs_from_celery(job_ids)
+        queued = (
+            job_manager.get_queued_jobs()
+            if any(job.status == "queued" for job in jobs)
+            else []
+        )
+        return [_job_status_response(job, queued) for job in jobs]
+
+    except Exception as e:
+        logger.error(f"Error getting jobs status: {str(e)}")
+        raise HTTPException(
+            status_code=500, detail=f"Error getting jobs status: {str(e)}"
+        )
+
+
 @router.get(
     "/status/{job_id}",
     operation_id="get_job_status",
@@ -162,28 +226,8 @@ async def get_job_status(job_id: str, _key: Annotated[str, Depends(verify_api_ke
         if not job:
             raise HTTPException(status_code=404, detail="Job not found")
 
-        queue_position = 0
-        estimated_wait_time = "00:00:00"
-
-        if job.status == "queued":
-            queued = job_manager.get_queued_jobs()
-            match = next((q for q in queued if q["job_id"] == job_id), None)
-            if match:
-                queue_position = match["queue_position"]
-                estimated_wait_time = match["estimated_wait_time"]
-
-        return {
-            "job_id": job.job_id,
-            "external_id": job.external_id,
-            "job_type": job.job_type,
-            "status": job.status,
-            "progress": job.progress,
-            "queue_position": queue_position,
-            "estimated_wait_time": estimated_wait_time,
-            "start_time": job.start_time.isoformat() if job.start_time else None,
-            "end_time": job.end_time.isoformat() if job.end_time else None,
-            "error_message": job.error_message,
-        }
+        queued = job_manager.get_queued_jobs() if job.status == "queued" else []
+        return _job_status_response(job, queued)
 
     except HTTPException:
         raise
@@ -221,8 +265,8 @@ async def get_job_results(job_id: str, _key: Annotated[str, Depends(verify_api_k
         if not job.result_path or not os.path.exists(job.result_path):
             return {"status": "not-found", "data": None}
 
-        with open(job.result_path) as f:
-            result_data = json.load(f)
+        with open(job.result_path, "rb") as f:
+            result_data = orjson.loads(f.read())
 
         return {
             "status": "completed",
@@ -10,6 +10,7 @@ CELERY_TASK_TIMEOUT = int(os.getenv("CELERY_TASK_TIMEOUT", 3600))
 CELERY_VISIBILITY_TIMEOUT = int(
     os.getenv("CELERY_VISIBILITY_TIMEOUT", max(CELERY_TASK_TIMEOUT + 300, 600))
 )
+REDIS_POOL_SIZE = int(os.getenv("REDIS_POOL_SIZE", 32))
 
 celery_app = Celery(
     "celluloid_vision",
@@ -37,6 +38,10 @@ celery_app.conf.update(
     # Redis broker: if a worker dies before ack, redeliver after visibility timeout.
     # Keep this >= max task runtime to avoid duplicate concurrent execution.
     broker_transport_options={"visibility_timeout": CELERY_VISIBILITY_TIMEOUT},
+    # Share a bounded set of keep-alive connections for broker and results.
+    broker_pool_limit=REDIS_POOL_SIZE,
+    redis_max_connections=REDIS_POOL_SIZE,
+    redis_socket_keepalive=True,
     task_default_queue=CELERY_QUEUE_NAME,
     result_expires=86400,  # Results expire after 24 hours
     # Soft limit lets the task catch SoftTimeLimitExceeded and clean up.
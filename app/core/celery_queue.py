@@ -2,6 +2,9 @@
 
 import ast
 import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from typing import List, Optional
 
@@ -13,6 +16,9 @@ from app.models.schemas import JobStatus
 logger = logging.getLogger(__name__)
 
 ESTIMATED_MINUTES_PER_JOB = 5
+# Seconds a Celery inspect snapshot is reused, so the several lookups one
+# request makes (job state, queue position, ...) share a single broadcast
+INSPECT_SNAPSHOT_TTL = 1.0
 
 TASK_NAME_BY_JOB_TYPE = {
     "object_detect": "app.core.tasks.process_object_detect_task",
@@ -20,10 +26,28 @@ TASK_NAME_BY_JOB_TYPE = {
 }
 
 
+def _format_wait(position: int) -> str:
+    """HH:MM:SS wait estimate for the job at a 1-based queue position."""
+    wait_seconds = position * ESTIMATED_MINUTES_PER_JOB * 60
+    h, rem = divmod(wait_seconds, 3600)
+    m, s = divmod(rem, 60)
+    return f"{h:02d}:{m:02d}:{s:02d}"
+
+
 class CeleryJobManager:
     def __init__(self, queue_name: str = CELERY_QUEUE_NAME):
         """Initialize Celery job manager."""
         self.queue_name = queue_name
+        self._snapshot = None
+        self._snapshot_time = 0.0
+        self._snapshot_lock = threading.Lock()
+        # active/reserved/scheduled broadcasts each wait out the inspect
+        # timeout, so they are issued in parallel
+        self._inspect_executor = ThreadPoolExecutor(
+            max_workers=3, thread_name_prefix="celery-inspect"
+        )
+        # Inspect holds no per-call state, so one instance serves every broadcast
+        self._inspector = celery_app.control.inspect(timeout=1.0)
         logger.info("Initialized Celery job manager with queue: %s", queue_name)
 
     def ping(self) -> bool:
@@ -63,85 +87,152 @@ class CeleryJobManager:
             callback_url=payload.get("callback_url"),
             params=payload.get("params"),
         )
-        job.status = status
+        job.set_status(status)
         job.progress = progress
         return job
 
     def _inspect_tasks(self) -> tuple[list[dict], list[dict], list[dict]]:
-        """Return (active, reserved, scheduled) task lists from Celery inspect."""
-        inspector = celery_app.control.inspect(timeout=1.0)
-        active = [t for tasks in (inspector.active() or {}).values() for t in tasks]
-        reserved = [t for tasks in (inspector.reserved() or {}).values() for t in tasks]
-        scheduled = [
-            t for tasks in (inspector.scheduled() or {}).values() for t in tasks
-        ]
+        """Return (active, reserved, scheduled) task lists from Celery inspect.
+
+        Snapshots younger than INSPECT_SNAPSHOT_TTL are reused.
+        """
+        with self._snapshot_lock:
+            age = time.monotonic() - self._snapshot_time
+            if self._snapshot is None or age >= INSPECT_SNAPSHOT_TTL:
+                self._snapshot = self._fetch_tasks()
+                self._snapshot_time = time.monotonic()
+            return self._snapshot
+
+    def _invalidate_snapshot(self) -> None:
+        """Drop the cached inspect snapshot after changing the queue."""
+        with self._snapshot_lock:
+            self._snapshot = None
+
+    def _fetch_tasks(self) -> tuple[list[dict], list[dict], list[dict]]:
+        """Query Celery inspect for (active, reserved, scheduled) task lists."""
+
+        def inspect(method: str) -> list[dict]:
+            replies = getattr(self._inspector, method)() or {}
+            return [t for tasks in replies.values() for t in tasks]
+
+        active, reserved, scheduled = self._inspect_executor.map(
+            inspect, ("active", "reserved", "scheduled")
+        )
         return active, reserved, scheduled
 
+    def _task_metas(self, job_ids: List[str]) -> List[dict]:
+        """Fetch stored task metadata for several jobs in one backend round trip."""
+        backend = celery_app.backend
+        if not hasattr(backend, "mget"):
+            return [
+                AsyncResult(job_id, app=celery_app)._get_task_meta()
+                for job_id in job_ids
+            ]
+        values = backend.mget([backend.get_key_for_task(job_id) for job_id in job_ids])
+        return [
+            (
+                backend.decode_result(value)
+                if value
+                else {"status": "PENDING", "result": None}
+            )
+            for value in values
+        ]
+
+    def _job_from_state(
+        self, job_id: str, celery_state: str, info, tasks=None
+    ) -> Optional[JobStatus]:
+        """Build a JobStatus from a Celery state and its stored info.
+
+        tasks is an optional (active, reserved, scheduled) snapshot used to
+        resolve PENDING jobs; it is fetched from Celery inspect when omitted.
+        """
+        if celery_state in ("STARTED", "PROCESSING"):
+            task_info = info if isinstance(info, dict) else {}
+            job = self._job_from_payload(
+                job_id=job_id,
+                payload=task_info,
+                status="processing",
+                progress=float(task_info.get("progress", 0.0)),
+            )
+            if task_info.get("start_time"):
+                job.start_time = datetime.fromisoformat(task_info["start_time"])
+            return job
+
+        if celery_state == "SUCCESS":
+            task_result = info if isinstance(info, dict) else {}
+            job = self._job_from_payload(
+                job_id=job_id,
+                payload=task_result,
+                status="completed",
+                progress=100.0,
+            )
+            job.result_path = task_result.get("result_path")
+            job.metadata = task_result.get("metadata", {})
+            if task_result.get("start_time"):
+                job.start_time = datetime.fromisoformat(task_result["start_time"])
+            if task_result.get("end_time"):
+                job.end_time = datetime.fromisoformat(task_result["end_time"])
+            return job
+
+        if celery_state == "FAILURE":
+            payload = info if isinstance(info, dict) else {}
+            job = self._job_from_payload(
+                job_id=job_id, payload=payload, status="failed", progress=0.0
+            )
+            job.error_message = str(info) if info else None
+            return job
+
+        if celery_state == "REVOKED":
+            job = self._job_from_payload(
+                job_id=job_id, payload={}, status="failed", progress=0.0
+            )
+            job.error_message = "Task revoked"
+            return job
+
+        # PENDING can mean queued or unknown; inspect queue/worker tasks to decide.
+        active, reserved, scheduled = tasks or self._inspect_tasks()
+        for task in active:
+            if task.get("id") == job_id:
+                payload = self._extract_job_data(task)
+                return self._job_from_payload(job_id, payload, "processing")
+        for task in reserved + scheduled:
+            if task.get("id") == job_id:
+                payload = self._extract_job_data(task)
+                return self._job_from_payload(job_id, payload, "queued")
+
+        return None
+
     def get_job_from_celery(self, job_id: str) -> Optional[JobStatus]:
         """Get job status from Celery task state and inspect output."""
         try:
             result = AsyncResult(job_id, app=celery_app)
-            celery_state = result.state
-
-            if celery_state in ("STARTED", "PROCESSING"):
-                task_info = result.info if isinstance(result.info, dict) else {}
-                job = self._job_from_payload(
-                    job_id=job_id,
-                    payload=task_info,
-                    status="processing",
-                    progress=float(task_info.get("progress", 0.0)),
-                )
-                if task_info.get("start_time"):
-                    job.start_time = datetime.fromisoformat(task_info["start_time"])
-                return job
-
-            if celery_state == "SUCCESS":
-                task_result = result.result if isinstance(result.result, dict) else {}
-                job = self._job_from_payload(
-                    job_id=job_id,
-                    payload=task_result,
-                    status="completed",
-                    progress=100.0,
-                )
-                job.result_path = task_result.get("result_path")
-                job.metadata = task_result.get("metadata", {})
-                if task_result.get("start_time"):
-                    job.start_time = datetime.fromisoformat(task_result["start_time"])
-                if task_result.get("end_time"):
-                    job.end_time = datetime.fromisoformat(task_result["end_time"])
-                return job
-
-            if celery_state == "FAILURE":
-                info = result.info if isinstance(result.info, dict) else {}
-                job = self._job_from_payload(
-                    job_id=job_id, payload=info, status="failed", progress=0.0
-                )
-                job.error_message = str(result.result) if result.result else None
-                return job
-
-            if celery_state == "REVOKED":
-                job = self._job_from_payload(
-                    job_id=job_id, payload={}, status="failed", progress=0.0
-                )
-                job.error_message = "Task revoked"
-                return job
-
-            # PENDING can mean queued or unknown; inspect queue/worker tasks to decide.
-            active, reserved, scheduled = self._inspect_tasks()
-            for task in active:
-                if task.get("id") == job_id:
-                    payload = self._extract_job_data(task)
-                    return self._job_from_payload(job_id, payload, "processing")
-            for task in reserved + scheduled:
-                if task.get("id") == job_id:
-                    payload = self._extract_job_data(task)
-                    return self._job_from_payload(job_id, payload, "queued")
-
-            return None
+            return self._job_from_state(job_id, result.state, result.info)
         except Exception as e:
             logger.error("Error getting job %s from Celery: %s", job_id, str(e))
             return None
 
+    def get_jobs_from_celery(self, job_ids: List[str]) -> List[JobStatus]:
+        """Get the status of several jobs, skipping unknown ids.
+
+        Task states are read in a single backend round trip and Celery
+        inspect is queried at most once for all PENDING jobs.
+        """
+        jobs: list[JobStatus] = []
+        try:
+            tasks = None
+            for job_id, meta in zip(job_ids, self._task_metas(job_ids)):
+                celery_state = meta.get("status", "PENDING")
+                if celery_state == "PENDING" and tasks is None:
+                    tasks = self._inspect_tasks()
+                job = self._job_from_state(
+                    job_id, celery_state, meta.get("result"), tasks
+                )
+                if job:
+                    jobs.append(job)
+        except Exception as e:
+            logger.error("Error getting jobs from Celery: %s", str(e))
+        return jobs
+
     def save_job_to_celery(self, job: JobStatus):
         """Compatibility no-op (Celery is source of truth)."""
         logger.debug("save_job_to_celery no-op for job %s", job.job_id)
@@ -214,6 +305,7 @@ class CeleryJobManager:
                 task_id=job.job_id,
                 queue=self.queue_name,
             )
+            self._invalidate_snapshot()
 
             logger.info(
                 "Enqueued %s job %s to Celery queue %s",
@@ -240,38 +332,36 @@ class CeleryJobManager:
         try:
             result = AsyncResult(job_id, app=celery_app)
             result.revoke(terminate=True)
+            self._invalidate_snapshot()
             logger.info("Cancelled job %s", job_id)
         except Exception as e:
             logger.warning("Could not cancel job %s: %s", job_id, str(e))
 
     def get_queued_jobs(self):
         """Get list of queued jobs with estimated wait time."""
-        queued_jobs = []
         try:
-            jobs = self.get_all_jobs()
-            queued = [j for j in jobs if j.status == "queued"]
-
-            for i, job in enumerate(queued):
-                wait_seconds = (i + 1) * ESTIMATED_MINUTES_PER_JOB * 60
-                h = wait_seconds // 3600
-                m = (wait_seconds % 3600) // 60
-                s = wait_seconds % 60
-                queued_jobs.append(
-                    {
-                        "job_id": job.job_id,
-                        "external_id": job.external_id,
-                        "queue_position": i + 1,
-                        "estimated_wait_time": f"{h:02d}:{m:02d}:{s:02d}",
-                    }
-                )
+            _active, reserved, scheduled = self._inspect_tasks()
+            queued = [task for task in reserved + scheduled if task.get("id")]
+            return [
+                {
+                    "job_id": task["id"],
+                    "external_id": self._extract_job_data(task).get(
+                        "external_id", "unknown"
+                    ),
+                    "queue_position": position,
+                    "estimated_wait_time": _format_wait(position),
+                }
+                for position, task in enumerate(queued, start=1)
+            ]
         except Exception as e:
             logger.error("Error getting queued jobs: %s", str(e))
-        return queued_jobs
+            return []
 
     def clean_queue(self):
         """Purge all pending tasks from the Celery queue."""
         try:
             celery_app.control.purge()
+            self._invalidate_snapshot()
             logger.info("Celery queue cleaned.")
         except Exception as e:
             logger.error("Error cleaning Celery queue: %s", str(e))
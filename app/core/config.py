@@ -16,6 +16,24 @@ PORT = 8081
 
 # Redis Configuration
 REDIS_URL = os.getenv("REDIS_URL", "redis://localhost:6379")
+# Maximum connections kept by each shared Redis connection pool
+REDIS_POOL_SIZE = int(os.getenv("REDIS_POOL_SIZE", 32))
 
 # Processing Configuration
 MAX_WORKERS = 1  # Only 1 worker since we process one job at a time
+
+# Detection Configuration
+# "mediapipe" (default) or "onnxruntime"; the latter needs the detector model
+# exported to ONNX and its labels file, and falls back to MediaPipe otherwise
+DETECTION_BACKEND = os.getenv("DETECTION_BACKEND", "mediapipe").lower()
+ORT_DETECTOR_MODEL = os.getenv("ORT_DETECTOR_MODEL")
+ORT_DETECTOR_LABELS = os.getenv("ORT_DETECTOR_LABELS")
+
+# Video Decoding Configuration
+# Hardware acceleration for the FFmpeg backend: ANY, VAAPI, MFX or D3D11. A
+# decoder device index can only be chosen with a specific acceleration type.
+VIDEO_HW_ACCELERATION = os.getenv("VIDEO_HW_ACCELERATION", "ANY").upper()
+VIDEO_HW_DEVICE = os.getenv("VIDEO_HW_DEVICE")
+# Optional GStreamer pipeline tried first for local files, "{path}" being
+# replaced with the video path; it must end in an appsink producing BGR frames
+GSTREAMER_PIPELINE = os.getenv("GSTREAMER_PIPELINE")
@@ -1,6 +1,24 @@
 """Shared dependencies and services"""
 
+import redis
+import redis.asyncio as aioredis
+
 from app.core.celery_queue import CeleryJobManager
+from app.core.config import REDIS_POOL_SIZE, REDIS_URL
 
 # Initialize Celery job manager (singleton)
 job_manager = CeleryJobManager()
+
+# Shared Redis connection pools; build clients with Redis(connection_pool=...)
+redis_pool = redis.ConnectionPool.from_url(
+    REDIS_URL,
+    max_connections=REDIS_POOL_SIZE,
+    socket_keepalive=True,
+    decode_responses=True,
+)
+async_redis_pool = aioredis.ConnectionPool.from_url(
+    REDIS_URL,
+    max_connections=REDIS_POOL_SIZE,
+    socket_keepalive=True,
+    decode_responses=True,
+)
@@ -1,20 +1,34 @@
 """Celery tasks for video processing"""
 
-import json
+import gzip
 import logging
 import os
+import random
+import shutil
 import time
 import traceback
 from datetime import datetime
 
 import cv2
+import orjson
 import requests
+from celery.signals import worker_init
 
 from app.core.celery_app import celery_app
 from app.core.utils import download_video
 
 logger = logging.getLogger(__name__)
 
+# Compression level of the .gz copies of result files
+RESULT_GZIP_LEVEL = 6
+# Chunk size used when compressing result files
+COPY_BUFFER_SIZE = 1024 * 1024
+
+# Keep-alive session for job callbacks, so retries and later jobs handled by
+# the same worker process reuse the connection to the callback host
+_callback_session = requests.Session()
+CALLBACK_HEADERS = {"Content-Type": "application/json"}
+
 
 # ---------------------------------------------------------------------------
 # Shared helpers
@@ -42,10 +56,10 @@ def _send_callback_sync(
 
     for attempt in range(max_retries):
         try:
-            response = requests.post(
+            response = _callback_session.post(
                 callback_url,
-                json=callback_data,
-                headers={"Content-Type": "application/json"},
+                data=orjson.dumps(callback_data, option=orjson.OPT_SERIALIZE_NUMPY),
+                headers=CALLBACK_HEADERS,
                 timeout=30,
             )
             if 200 <= response.status_code < 300:
@@ -67,7 +81,8 @@ def _send_callback_sync(
             logger.warning(f"Callback attempt {attempt + 1} failed: {exc}")
 
         if attempt < max_retries - 1:
-            time.sleep(retry_delay)
+            # +/-20% jitter so workers failing against the same host spread out
+            time.sleep(retry_delay * random.uniform(0.8, 1.2))
             retry_delay *= 2
 
     logger.error(f"All callback attempts failed for job {job_id} to {callback_url}")
@@ -102,6 +117,31 @@ def _cleanup_video(video_url: str, video_path: str) -> None:
             logger.warning(f"Failed to clean up temporary video file: {str(e)}")
 
 
+def _write_gzip_copy(output_path: str) -> None:
+    """Write a gzip copy of a result file next to it for /outputs to serve"""
+    with (
+        open(output_path, "rb") as src,
+        gzip.open(output_path + ".gz", "wb", compresslevel=RESULT_GZIP_LEVEL) as dst,
+    ):
+        shutil.copyfileobj(src, dst, COPY_BUFFER_SIZE)
+
+
+@worker_init.connect
+def _prefetch_models(**_kwargs):
+    """Download the detection models before the worker accepts its first task.
+
+    Runs once in the parent process, so prefork children don't race to
+    download the same files.
+    """
+    try:
+        from app.detection.models import get_model_path
+
+        for model_type in ("detector", "embedder", "face"):
+            get_model_path(model_type)
+    except Exception as e:
+        logger.warning(f"Could not prefetch detection models: {str(e)}")
+
+
 def _make_progress_reporter(task, job_id, external_id, start_time):
     """Create a throttled progress callback for Celery state updates."""
     last_reported = [0.0]
@@ -188,8 +228,8 @@ def process_object_detect_task(self, job_data: dict):
                 f"{base_url}/{sprite_meta['url']}" if base_url else sprite_meta["url"]
             )
 
-        with open(output_path, "w") as f:
-            json.dump(results, f, indent=2)
+        detector.save_results(output_path)
+        _write_gzip_copy(output_path)
 
         logger.info(f"Result file saved to: {output_path}")
 
@@ -336,8 +376,9 @@ def process_scene_detect_task(self, job_data: dict):
         result_data = scene_result.model_dump()
         result_data["result_type"] = "scene_detect"
 
-        with open(output_path, "w") as f:
-            json.dump(result_data, f, indent=2)
+        with open(output_path, "wb") as f:
+            f.write(orjson.dumps(result_data, option=orjson.OPT_INDENT_2))
+        _write_gzip_copy(output_path)
 
         logger.info(f"Scene result file saved to: {output_path}")
 
@@ -1,5 +1,6 @@
 """Shared utilities"""
 
+import hashlib
 import logging
 import os
 import sys
@@ -65,3 +66,8 @@ def get_version():
             return f.read().strip()
     except FileNotFoundError:
         return "1.0.0"  # fallback version
+
+
+def make_etag(data: bytes) -> str:
+    """Return a quoted strong ETag for a response body or state snapshot."""
+    return f'"{hashlib.blake2b(data, digest_size=8).hexdigest()}"'
@@ -0,0 +1,11 @@
+import numpy as np
+
+
+def iou_batch(boxes: np.ndarray, box) -> np.ndarray:
+    """Intersection over union of one (x, y, width, height) box with each row of an (N, 4) array"""
+    x, y, w, h = box
+    ix = np.minimum(boxes[:, 0] + boxes[:, 2], x + w) - np.maximum(boxes[:, 0], x)
+    iy = np.minimum(boxes[:, 1] + boxes[:, 3], y + h) - np.maximum(boxes[:, 1], y)
+    inter = np.clip(ix, 0.0, None) * np.clip(iy, 0.0, None)
+    union = boxes[:, 2] * boxes[:, 3] + w * h - inter
+    return np.divide(inter, union, out=np.zeros_like(inter), where=union > 0)
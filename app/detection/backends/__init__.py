@@ -0,0 +1 @@
+"""Alternative inference backends for object detection"""
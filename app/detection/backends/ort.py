@@ -0,0 +1,167 @@
+"""
+ONNX Runtime object detection backend.
+
+Runs an EfficientDet-Lite style detector exported to ONNX (for example the
+MediaPipe .tflite model converted with tf2onnx) on the best available
+execution provider. The model takes one NHWC image batch and returns the four
+outputs of the TFLite detection post-processing op, in order: boxes
+(normalised ymin, xmin, ymax, xmax), class indices, scores and the number of
+detections. Results are MediaPipe DetectionResult objects, so the rest of the
+pipeline does not depend on the backend.
+"""
+
+import logging
+from typing import List, Optional
+
+import cv2
+import numpy as np
+import onnxruntime as ort
+from mediapipe.tasks.python.components.containers.bounding_box import BoundingBox
+from mediapipe.tasks.python.components.containers.category import Category
+from mediapipe.tasks.python.components.containers.detections import (
+    Detection,
+    DetectionResult,
+)
+
+logger = logging.getLogger(__name__)
+
+# Execution providers in order of preference; unavailable ones are skipped
+PREFERRED_PROVIDERS = [
+    "TensorrtExecutionProvider",
+    "CUDAExecutionProvider",
+    "CPUExecutionProvider",
+]
+
+# Input size used when the model has dynamic spatial dimensions
+DEFAULT_INPUT_SIZE = 320
+
+
+def _load_labels(labels_path: str) -> List[str]:
+    """Read one label per line, the line number being the class index"""
+    with open(labels_path, encoding="utf-8") as f:
+        return [line.strip() for line in f]
+
+
+class OrtObjectDetector:
+    """ONNX Runtime replacement for the MediaPipe ObjectDetector in VIDEO mode"""
+
+    def __init__(
+        self,
+        model_path: Optional[str],
+        labels_path: Optional[str],
+        max_results: int = 5,
+        score_threshold: float = 0.0,
+        use_gpu: bool = True,
+    ):
+        if not model_path or not labels_path:
+            raise ValueError(
+                "ORT_DETECTOR_MODEL and ORT_DETECTOR_LABELS must be set for the onnxruntime backend"
+            )
+
+        available = ort.get_available_providers()
+        providers = [p for p in PREFERRED_PROVIDERS if p in available]
+        if not use_gpu:
+            providers = ["CPUExecutionProvider"]
+
+        self.session = ort.InferenceSession(model_path, providers=providers)
+        self.labels = _load_labels(labels_path)
+        self.max_results = max_results
+        self.score_threshold = score_threshold
+
+        model_input = self.session.get_inputs()[0]
+        self.input_name = model_input.name
+        # Exports with a fixed batch of 1 are run one image at a time
+        self.batched = not isinstance(model_input.shape[0], int)
+        height, width = model_input.shape[1:3]
+        self.input_height = height if isinstance(height, int) else DEFAULT_INPUT_SIZE
+        self.input_width = width if isinstance(width, int) else DEFAULT_INPUT_SIZE
+        self.input_float = model_input.type == "tensor(float)"
+
+        logger.info(
+            "ONNX Runtime detector %s using %s",
+            model_path,
+            self.session.get_providers(),
+        )
+
+    def _preprocess(self, image: np.ndarray) -> np.ndarray:
+        """Resize an RGB image to the model input, as uint8 or [-1, 1] float"""
+        resized = cv2.resize(
+            image,
+            (self.input_width, self.input_height),
+            interpolation=cv2.INTER_AREA,
+        )
+        if self.input_float:
+            return (resized.astype(np.float32) - 127.5) / 127.5
+        return resized
+
+    def _postprocess(
+        self, boxes, classes, scores, count, image_width: int, image_height: int
+    ) -> DetectionResult:
+        """Convert one image's post-processed outputs into a DetectionResult"""
+        count = min(int(count), len(scores))
+        detections = []
+        for i in np.argsort(-scores[:count], kind="stable"):
+            score = float(scores[i])
+            if score < self.score_threshold:
+                break
+            ymin, xmin, ymax, xmax = np.clip(boxes[i], 0.0, 1.0)
+            index = int(classes[i])
+            name = self.labels[index] if 0 <= index < len(self.labels) else str(index)
+            detections.append(
+                Detection(
+                    bounding_box=BoundingBox(
+                        origin_x=int(xmin * image_width),
+                        origin_y=int(ymin * image_height),
+                        width=int((xmax - xmin) * image_width),
+                        height=int((ymax - ymin) * image_height),
+                    ),
+                    categories=[Category(index=index, score=score, category_name=name)],
+                )
+            )
+            if len(detections) >= self.max_results:
+                break
+        return DetectionResult(detections=detections)
+
+    def detect(self, image: np.ndarray) -> DetectionResult:
+        """Detect objects in an RGB image"""
+        batch = self._preprocess(image)[np.newaxis]
+        boxes, classes, scores, count = self.session.run(
+            None, {self.input_name: batch}
+        )[:4]
+        return self._postprocess(
+            boxes[0],
+            classes[0],
+            scores[0],
+            np.ravel(count)[0],
+            image.shape[1],
+            image.shape[0],
+        )
+
+    def detect_batch(self, images: List[np.ndarray]) -> List[DetectionResult]:
+        """Detect objects in several RGB images, in one run if the model allows"""
+        if not self.batched:
+            return [self.detect(image) for image in images]
+
+        batch = np.stack([self._preprocess(image) for image in images])
+        boxes, classes, scores, count = self.session.run(
+            None, {self.input_name: batch}
+        )[:4]
+        count = np.ravel(count)
+        return [
+            self._postprocess(
+                boxes[i],
+                classes[i],
+                scores[i],
+                count[i],
+                image.shape[1],
+                image.shape[0],
+            )
+            for i, image in enumerate(images)
+        ]
+
+    def detect_for_video(self, mp_image, timestamp_ms: int) -> DetectionResult:
+        """Same call as the MediaPipe VIDEO mode detector; frames are independent"""
+        return self.detect(mp_image.numpy_view())
+
+    def close(self) -> None:
+        self.session = None
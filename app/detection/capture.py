@@ -0,0 +1,78 @@
+import logging
+from typing import Optional
+
+import cv2
+
+from app.core.config import (
+    GSTREAMER_PIPELINE,
+    VIDEO_HW_ACCELERATION,
+    VIDEO_HW_DEVICE,
+)
+
+logger = logging.getLogger(__name__)
+
+NETWORK_SCHEMES = ("rtsp://", "rtmp://", "http://", "https://", "udp://", "tcp://")
+
+
+def is_network_source(video_path: str) -> bool:
+    """Whether the capture reads from a network stream rather than a local file"""
+    return video_path.lower().startswith(NETWORK_SCHEMES)
+
+
+def _open_gstreamer(video_path: str) -> Optional[cv2.VideoCapture]:
+    """Open a local file through GSTREAMER_PIPELINE, if configured and working"""
+    if not GSTREAMER_PIPELINE or is_network_source(video_path):
+        return None
+    try:
+        cap = cv2.VideoCapture(
+            GSTREAMER_PIPELINE.replace("{path}", video_path), cv2.CAP_GSTREAMER
+        )
+        if cap.isOpened():
+            return cap
+        cap.release()
+    except cv2.error as e:
+        logger.debug("GStreamer capture unavailable: %s", e)
+    logger.warning("GStreamer pipeline could not open %s, using FFmpeg", video_path)
+    return None
+
+
+def open_video_capture(video_path: str) -> cv2.VideoCapture:
+    """
+    Open a video with hardware decoding when available.
+
+    A configured GStreamer pipeline (e.g. NVDEC on Jetson) is tried first,
+    then the FFmpeg backend with VIDEO_HW_ACCELERATION on VIDEO_HW_DEVICE.
+    Falls back to the default constructor (software decoding) when the OpenCV
+    build does not support hardware acceleration or the video cannot be opened
+    that way.
+    """
+    cap = _open_gstreamer(video_path)
+    if cap is not None:
+        return cap
+
+    if hasattr(cv2, "CAP_PROP_HW_ACCELERATION"):
+        acceleration = getattr(
+            cv2,
+            f"VIDEO_ACCELERATION_{VIDEO_HW_ACCELERATION}",
+            cv2.VIDEO_ACCELERATION_ANY,
+        )
+        params = [cv2.CAP_PROP_HW_ACCELERATION, acceleration]
+        # OpenCV rejects a device index together with VIDEO_ACCELERATION_ANY
+        if VIDEO_HW_DEVICE and acceleration != cv2.VIDEO_ACCELERATION_ANY:
+            if not VIDEO_HW_DEVICE.isdigit():
+                logger.warning(
+                    "VIDEO_HW_DEVICE must be a device index, got %r; "
+                    "using software decoding",
+                    VIDEO_HW_DEVICE,
+                )
+                return cv2.VideoCapture(video_path)
+            params += [cv2.CAP_PROP_HW_DEVICE, int(VIDEO_HW_DEVICE)]
+        try:
+            cap = cv2.VideoCapture(video_path, cv2.CAP_FFMPEG, params)
+            if cap.isOpened():
+                return cap
+            cap.release()
+        except cv2.error as e:
+            logger.debug("Hardware accelerated capture unavailable: %s", e)
+
+    return cv2.VideoCapture(video_path)
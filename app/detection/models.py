@@ -1,5 +1,8 @@
 import logging
 import os
+from typing import Any, Callable
+
+from mediapipe.tasks import python
 
 from app.core.utils import download_file, ensure_dir
 
@@ -38,3 +41,33 @@ def get_model_path(model_type: str = "detector") -> str:
         download_file(model_url, model_path)
 
     return model_path
+
+
+def create_task(
+    task_cls: Any,
+    model_type: str,
+    build_options: Callable[[python.BaseOptions], Any],
+    use_gpu: bool = True,
+) -> Any:
+    """
+    Create a MediaPipe vision task, preferring the GPU delegate.
+
+    build_options receives the BaseOptions and returns the task options. If
+    the GPU delegate cannot be initialised the task is created on CPU.
+    """
+    model_path = get_model_path(model_type)
+
+    if use_gpu:
+        try:
+            base_options = python.BaseOptions(
+                model_asset_path=model_path,
+                delegate=python.BaseOptions.Delegate.GPU,
+            )
+            return task_cls.create_from_options(build_options(base_options))
+        except Exception as e:
+            logger.warning(
+                "GPU delegate unavailable for %s model, using CPU: %s", model_type, e
+            )
+
+    base_options = python.BaseOptions(model_asset_path=model_path)
+    return task_cls.create_from_options(build_options(base_options))
@@ -3,25 +3,31 @@ import json
 import cv2
 import numpy as np
 import time
-from typing import Dict
+from typing import Any, Dict, List, Optional, Tuple
 import mediapipe as mp
-from mediapipe.tasks import python
 from mediapipe.tasks.python import vision
 import logging
 import os
+import queue
 import sys
+import tempfile
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
 from datetime import datetime
+from fractions import Fraction
 
-# Import detection types
-from app.models.schemas import (
-    DetectionResults,
+from app.core.config import (
+    DETECTION_BACKEND,
+    ORT_DETECTOR_LABELS,
+    ORT_DETECTOR_MODEL,
 )
 from app.core.utils import (
     get_log_level,
     download_video,
     get_version,
 )
-from app.detection.models import get_model_path
+from app.detection.capture import is_network_source, open_video_capture
+from app.detection.models import create_task
 from app.detection.sprite import SpriteGenerator
 from app.detection.tracker import ObjectTracker
 
@@ -29,6 +35,23 @@ from app.detection.tracker import ObjectTracker
 logging.basicConfig(level=get_log_level())
 logger = logging.getLogger(__name__)
 
+# Maximum number of objects the detector returns per frame
+MAX_DETECTIONS_PER_FRAME = 5
+# A tracked person whose face was confirmed is trusted for this many frames
+# before the face detector is run on it again.
+FACE_RECHECK_FRAMES = 30
+# Frames are compared at MOTION_THUMB_SIZE in grayscale; when the mean absolute
+# difference to the last frame the detector ran on is below MOTION_THRESHOLD,
+# that frame's detections are reused instead of running the detector again.
+MOTION_THUMB_SIZE = (64, 36)
+MOTION_THRESHOLD = 2.0
+# Maximum number of frames passed to the detector in one call, for backends
+# that support batching
+DETECTION_BATCH_SIZE = 8
+# Maximum number of frames buffered between the decode, inference and output
+# stages of process_video
+PIPELINE_QUEUE_SIZE = 8
+
 
 class ObjectDetector:
     def __init__(
@@ -38,34 +61,32 @@ class ObjectDetector:
         similarity_threshold: float = 0.5,
         external_id: str = None,
         analysis_fps: float = 1.0,
+        use_gpu: bool = True,
     ):
-        # Initialize MediaPipe Object Detection
-        model_path = get_model_path("detector")
-        base_options = python.BaseOptions(model_asset_path=model_path)
-        options = vision.ObjectDetectorOptions(
-            base_options=base_options,
-            running_mode=vision.RunningMode.VIDEO,
-            max_results=5,
-            score_threshold=min_score,
-        )
-        self.detector = vision.ObjectDetector.create_from_options(options)
+        # Initialize Object Detection (MediaPipe unless configured otherwise)
+        self.detector = self._create_detector(min_score, use_gpu)
 
         # Initialize MediaPipe Face Detector
-        face_model_path = get_model_path("face")
-        face_base_options = python.BaseOptions(model_asset_path=face_model_path)
-        face_options = vision.FaceDetectorOptions(face_base_options)
-        self.face_detector = vision.FaceDetector.create_from_options(face_options)
+        self.face_detector = create_task(
+            vision.FaceDetector, "face", vision.FaceDetectorOptions, use_gpu
+        )
 
-        self.tracker = ObjectTracker(similarity_threshold)
+        self.tracker = ObjectTracker(similarity_threshold, use_gpu=use_gpu)
         self.output_path = output_path
         self.external_id = external_id
         self.analysis_fps = analysis_fps
         self.results = None
+        self._frames_spool = None
         self.start_time = None
         self.frame_count = 0
         self.processed_frames = 0
         self.frames_with_detections = 0
         self.last_timestamp = -1
+        self._last_progress_pct = -1
+        self._motion_thumb = None
+        self._motion_detections = None
+        self._rgb_ring = []
+        self._rgb_next = 0
         self.sprite_generator = None
         self.object_sprite_refs: Dict[str, str] = {}
 
@@ -79,21 +100,47 @@ class ObjectDetector:
             "class_counts": {},
         }
 
+    @staticmethod
+    def _create_detector(min_score: float, use_gpu: bool):
+        """
+        Create the object detector for DETECTION_BACKEND, falling back to
+        MediaPipe when the ONNX Runtime backend cannot be initialised.
+        """
+        if DETECTION_BACKEND == "onnxruntime":
+            try:
+                from app.detection.backends.ort import OrtObjectDetector
+
+                return OrtObjectDetector(
+                    ORT_DETECTOR_MODEL,
+                    ORT_DETECTOR_LABELS,
+                    max_results=MAX_DETECTIONS_PER_FRAME,
+                    score_threshold=min_score,
+                    use_gpu=use_gpu,
+                )
+            except Exception as e:
+                logger.warning(
+                    "ONNX Runtime detector unavailable, using MediaPipe: %s", e
+                )
+
+        return create_task(
+            vision.ObjectDetector,
+            "detector",
+            lambda base_options: vision.ObjectDetectorOptions(
+                base_options=base_options,
+                running_mode=vision.RunningMode.VIDEO,
+                max_results=MAX_DETECTIONS_PER_FRAME,
+                score_threshold=min_score,
+            ),
+            use_gpu,
+        )
+
     def has_face(self, image: np.ndarray) -> bool:
-        """Check if the image contains a face - used to improve person detection accuracy"""
+        """Check if the RGB image contains a face - used to improve person detection accuracy"""
         try:
-            # Convert to RGB if needed
-            if len(image.shape) == 2:
-                image_rgb = cv2.cvtColor(image, cv2.COLOR_GRAY2RGB)
-            elif image.shape[2] == 4:
-                image_rgb = cv2.cvtColor(image, cv2.COLOR_BGRA2RGB)
-            elif image.shape[2] == 3:
-                image_rgb = cv2.cvtColor(image, cv2.COLOR_BGR2RGB)
-            else:
-                image_rgb = image
-
-            # Create MediaPipe Image
-            mp_image = mp.Image(image_format=mp.ImageFormat.SRGB, data=image_rgb)
+            # Crops are views into the frame; MediaPipe needs contiguous data
+            mp_image = mp.Image(
+                image_format=mp.ImageFormat.SRGB, data=np.ascontiguousarray(image)
+            )
 
             # Detect faces
             detection_result = self.face_detector.detect(mp_image)
@@ -108,26 +155,386 @@ class ObjectDetector:
             logger.warning(f"Error in face detection: {str(e)}")
             return False
 
+    def _report_progress(self, frame_idx: int, progress_callback=None) -> None:
+        """Write progress to stdout and the callback each time it reaches a new whole percent"""
+        if self.frame_count <= 0:
+            return  # Unknown length (e.g. a live stream)
+        progress = (frame_idx / self.frame_count) * 100
+        percent = int(progress)
+        if percent == self._last_progress_pct:
+            return
+        self._last_progress_pct = percent
+
+        sys.stdout.write(f"\rProcessing: {progress:.1f}%")
+        sys.stdout.flush()
+        if progress_callback:
+            progress_callback(progress)
+
+    def _read_frames(
+        self,
+        cap: cv2.VideoCapture,
+        frame_interval: int,
+        read_q: queue.Queue,
+        stop: threading.Event,
+        retry_reads: bool = False,
+    ) -> None:
+        """
+        Reader stage: read every frame_interval-th frame and queue it as
+        (frame_idx, frame), followed by a None sentinel.
+
+        A failed read ends a local file; with retry_reads (network streams)
+        it is retried a few times first.
+        """
+
+        def put(item) -> bool:
+            while not stop.is_set():
+                try:
+                    read_q.put(item, timeout=0.1)
+                    return True
+                except queue.Full:
+                    continue
+            return False
+
+        frame_idx = 0
+        consecutive_failures = 0
+        max_failures = 5
+
+        try:
+            while cap.isOpened() and not stop.is_set():
+                sampled = frame_idx % frame_interval == 0
+                # Frames between samples are only grabbed, not retrieved, so
+                # they are never converted to BGR images
+                if sampled:
+                    ret, frame = cap.read()
+                else:
+                    ret = cap.grab()
+                if not ret:
+                    consecutive_failures += 1
+                    if not retry_reads or consecutive_failures >= max_failures:
+                        break
+                    time.sleep(0.1)
+                    continue
+
+                consecutive_failures = 0
+
+                if sampled and not put((frame_idx, frame)):
+                    break
+
+                frame_idx += 1
+                self.processed_frames = frame_idx
+        except Exception as e:
+            logger.error(f"Error reading frame {frame_idx}: {str(e)}")
+        finally:
+            put(None)
+
+    def _write_frames(self, write_q: queue.Queue) -> None:
+        """
+        Writer stage: paste first-sighting thumbnails into the sprite and
+        spool frames to disk until a None sentinel is received.
+        """
+        while True:
+            item = write_q.get()
+            if item is None:
+                break
+            frame, frame_data = item
+            frame_idx = frame_data["frame_idx"]
+
+            try:
+                for obj in frame_data["objects"]:
+                    obj_id = obj["id"]
+                    # Only create a sprite thumbnail for the first sighting
+                    # of an object; reuse it for all future detections.
+                    # Use the full frame (not the cropped object region) so
+                    # the thumbnail is a complete screenshot; the bbox
+                    # remains in original video coordinates.
+                    if obj_id not in self.object_sprite_refs:
+                        fragment_id = self.sprite_generator.add_thumbnail(
+                            frame, obj_id, frame_idx
+                        )
+                        self.object_sprite_refs[obj_id] = (
+                            f"sprite.jpg{fragment_id}"  # Just filename + fragment
+                        )
+                    obj["thumbnail"] = self.object_sprite_refs[obj_id]
+
+                # Frames are spooled to disk as one JSON document per line
+                # instead of being kept in memory until the end
+                self._frames_spool.write(json.dumps(frame_data))
+                self._frames_spool.write("\n")
+            except Exception as e:
+                logger.error(f"Error writing frame {frame_idx}: {str(e)}")
+
+    @staticmethod
+    def _take_batch(read_q: queue.Queue, batch_size: int) -> Tuple[list, bool]:
+        """
+        Wait for the next frame from the reader, then take up to batch_size
+        frames that are already queued. Returns the items and whether the
+        end-of-video sentinel was reached.
+        """
+        items = []
+        item = read_q.get()
+        while item is not None:
+            items.append(item)
+            if len(items) >= batch_size:
+                return items, False
+            try:
+                item = read_q.get_nowait()
+            except queue.Empty:
+                return items, False
+        return items, True
+
+    def _prepare_batch(
+        self, batch: list, ms_num: int, ms_den: int
+    ) -> Tuple[List[np.ndarray], List[int]]:
+        """RGB frames and millisecond timestamps for a batch of (frame_idx, frame)"""
+        frames = []
+        timestamps = []
+        for frame_idx, frame in batch:
+            timestamp = frame_idx * ms_num // ms_den
+
+            # Ensure timestamp is monotonically increasing
+            if timestamp <= self.last_timestamp:
+                timestamp = self.last_timestamp + 1
+            self.last_timestamp = timestamp
+
+            # Convert once to RGB; MediaPipe, the crops and the sprite all use
+            # this buffer. It is taken from a ring of preallocated buffers
+            # instead of allocating a new frame each time.
+            slot = self._rgb_next % len(self._rgb_ring)
+            self._rgb_next += 1
+            rgb = self._rgb_ring[slot]
+            if rgb is None or rgb.shape != frame.shape:
+                rgb = self._rgb_ring[slot] = np.empty_like(frame)
+            frames.append(cv2.cvtColor(frame, cv2.COLOR_BGR2RGB, dst=rgb))
+            timestamps.append(timestamp)
+        return frames, timestamps
+
+    def _track_batch(
+        self,
+        batch: list,
+        frames: List[np.ndarray],
+        timestamps: List[int],
+        detections_future: Future,
+        frame_interval: int,
+        face_executor: ThreadPoolExecutor,
+        write_q: queue.Queue,
+        progress_callback=None,
+    ) -> None:
+        """Track the detections of a batch and queue its frames for output"""
+        try:
+            batch_detections = detections_future.result()
+        except Exception as e:
+            logger.error(
+                f"Error detecting objects in frames {batch[0][0]}-{batch[-1][0]}: {str(e)}"
+            )
+            batch_detections = [[] for _ in batch]
+
+        for (frame_idx, _), frame, timestamp, detections in zip(
+            batch, frames, timestamps, batch_detections
+        ):
+            try:
+                frame_data = self._detect_frame(
+                    frame,
+                    frame_idx,
+                    timestamp,
+                    frame_interval,
+                    face_executor,
+                    detections,
+                )
+                if frame_data is not None:
+                    write_q.put((frame, frame_data))
+            except Exception as e:
+                logger.error(f"Error processing frame {frame_idx}: {str(e)}")
+
+            # Show progress percentage
+            self._report_progress(frame_idx + 1, progress_callback)
+
+    def _run_detector(self, frames: List[np.ndarray], timestamps: List[int]) -> list:
+        """Detections for each RGB frame, in one call when the backend batches"""
+        if hasattr(self.detector, "detect_batch"):
+            return [result.detections for result in self.detector.detect_batch(frames)]
+
+        detections = []
+        for frame, timestamp in zip(frames, timestamps):
+            # Create MediaPipe Image
+            mp_image = mp.Image(image_format=mp.ImageFormat.SRGB, data=frame)
+
+            # Process frame
+            frame_results = self.detector.detect_for_video(mp_image, timestamp)
+            detections.append(frame_results.detections)
+        return detections
+
+    def _detect_with_motion_gate(
+        self, frames: List[np.ndarray], timestamps: List[int]
+    ) -> list:
+        """
+        Detections for each RGB frame. A frame that barely differs from the
+        last frame the detector ran on reuses that frame's detections instead
+        of running the detector.
+        """
+        # Each frame's source is either a list of detections carried over
+        # from earlier batches or the index of a frame to run detection on
+        source = self._motion_detections
+        sources = []
+        pending = []
+        for i, frame in enumerate(frames):
+            thumb = cv2.resize(
+                cv2.cvtColor(frame, cv2.COLOR_RGB2GRAY),
+                MOTION_THUMB_SIZE,
+                interpolation=cv2.INTER_AREA,
+            )
+            if (
+                self._motion_thumb is None
+                or cv2.absdiff(thumb, self._motion_thumb).mean() >= MOTION_THRESHOLD
+            ):
+                self._motion_thumb = thumb
+                source = len(pending)
+                pending.append(i)
+            sources.append(source)
+
+        detected = []
+        if pending:
+            detected = self._run_detector(
+                [frames[i] for i in pending], [timestamps[i] for i in pending]
+            )
+        self._motion_detections = (
+            detected[source] if isinstance(source, int) else source
+        )
+        return [detected[s] if isinstance(s, int) else s for s in sources]
+
+    def _detect_frame(
+        self,
+        frame: np.ndarray,
+        frame_idx: int,
+        timestamp: int,
+        frame_interval: int,
+        face_executor: ThreadPoolExecutor,
+        detections: list,
+    ) -> Optional[Dict]:
+        """
+        Compute stage: filter and track the detected objects in one RGB frame.
+
+        Returns the frame entry for the results (without sprite thumbnails),
+        or None when nothing was kept.
+        """
+        if not detections:
+            return None
+
+        self.frames_with_detections += 1
+        frame_data = {
+            "frame_idx": frame_idx,
+            "timestamp": timestamp / 1000.0,  # Convert back to seconds for JSON
+            "objects": [],
+        }
+
+        for detection in detections:
+            # Get bounding box
+            bbox = detection.bounding_box
+            x = int(bbox.origin_x)
+            y = int(bbox.origin_y)
+            w = int(bbox.width)
+            h = int(bbox.height)
+
+            # Get class and confidence
+            category = detection.categories[0]
+            class_name = category.category_name
+            confidence = category.score
+
+            # Track statistics
+            self.detection_stats["total_detections"] += 1
+            self.detection_stats["class_counts"][class_name] = (
+                self.detection_stats["class_counts"].get(class_name, 0) + 1
+            )
+
+            # Extract the detected object region
+            object_region = frame[y : y + h, x : x + w]
+            if object_region.size == 0:  # Check if region is valid
+                continue
+
+            # A box overlapping an object of the same class seen in the
+            # previous analysed frames is the same object; only fall back to
+            # the embedder when there is no such match.
+            obj_id, iou = self.tracker.find_overlapping_object(
+                class_name, bbox, frame_idx, 2 * frame_interval
+            )
+
+            # For person objects, check if they contain a face to improve
+            # accuracy. A tracked person whose face was confirmed recently is
+            # trusted without running the face detector again. The face check
+            # runs on its own thread while the embedding is computed here.
+            is_person = class_name == "person"
+            face_future = None
+            if is_person and self.tracker.needs_face_check(
+                obj_id, frame_idx, FACE_RECHECK_FRAMES
+            ):
+                face_future = face_executor.submit(self.has_face, object_region)
+
+            embedding_result = None
+            if obj_id is None:
+                # Get embedding and track object for ALL classes
+                embedding_result = self.tracker.get_embedding(object_region)
+
+            if is_person:
+                self.detection_stats["person_detections"] += 1
+                if face_future is not None and not face_future.result():
+                    self.detection_stats["person_without_face"] += 1
+                    if obj_id is not None:
+                        self.tracker.record_face_check(obj_id, frame_idx, False)
+                    logger.debug(
+                        f"Skipping person detection without face at frame {frame_idx}"
+                    )
+                    continue
+                else:
+                    self.detection_stats["person_with_face"] += 1
+                    # If person has face, we can be more confident in the detection
+                    # You could optionally boost confidence here
+            else:
+                self.detection_stats["other_detections"] += 1
+
+            if obj_id is not None:
+                self.tracker.update_by_id(obj_id, frame_idx, detection, bbox, iou)
+            else:
+                obj_id = self.tracker.update(
+                    frame_idx, detection, embedding_result, bbox
+                )
+
+            if face_future is not None:
+                self.tracker.record_face_check(obj_id, frame_idx, True)
+
+            # Add object to frame data; the writer fills in the thumbnail
+            frame_data["objects"].append(
+                {
+                    "id": obj_id,
+                    "class_name": class_name,
+                    "confidence": float(confidence),
+                    "bbox": {"x": x, "y": y, "width": w, "height": h},
+                }
+            )
+
+        # Only add frame to results if it has objects
+        return frame_data if frame_data["objects"] else None
+
     def process_video(
         self, video_path: str, video_source_url: str = None, progress_callback=None
-    ) -> DetectionResults:
+    ) -> Dict[str, Any]:
         """
-        Process video and return detections in TAO JSON format
+        Process video, detecting and tracking objects in TAO JSON format
+
+        Returns the "version" and "metadata" parts of the results. The frames
+        are spooled to a temporary file instead of being kept in memory;
+        save_results writes the complete results with them.
         """
         self.start_time = time.time()
         self.last_timestamp = -1
+        self._last_progress_pct = -1
+        self._motion_thumb = None
+        self._motion_detections = None
         self.object_sprite_refs = {}
 
         # Create temporary directory for sprite
-        import tempfile
-
         temp_dir = tempfile.mkdtemp(prefix="sprite_")
 
-        # Initialize sprite generator (no path needed)
-        self.sprite_generator = SpriteGenerator()
-
         # Open video capture
-        cap = cv2.VideoCapture(video_path)
+        cap = open_video_capture(video_path)
         if not cap.isOpened():
             raise ValueError(f"Could not open video: {video_path}")
 
@@ -153,149 +560,99 @@ class ObjectDetector:
                     "thumbnail_size": [160, 90],
                 },
             },
-            "frames": [],
         }
+        self._frames_spool = tempfile.TemporaryFile("w+", encoding="utf-8")
 
         frame_interval = max(1, int(round(fps / self.analysis_fps)))
+        self.tracker.scale_windows(fps, frame_interval)
 
-        frame_idx = 0
-        consecutive_failures = 0
-        max_failures = 5
-
-        while cap.isOpened():
-            ret, frame = cap.read()
-            if not ret:
-                consecutive_failures += 1
-                if consecutive_failures >= max_failures:
-                    break
-                time.sleep(0.1)
-                continue
+        # Initialize sprite generator (no path needed)
+        self.sprite_generator = SpriteGenerator()
 
-            consecutive_failures = 0
+        # Frame index -> milliseconds with integer math: fps as a reduced
+        # fraction (e.g. 30000/1001) gives ms = frame_idx * 1000 * den // num
+        fps_ratio = Fraction(fps).limit_denominator(1001)
+        ms_num = 1000 * fps_ratio.denominator
+        ms_den = fps_ratio.numerator
+
+        # The face detector only ever runs on this single worker thread, so it
+        # can overlap with the embedder running on the calling thread.
+        face_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="face")
+        # Likewise the object detector (and the motion gate state) is only
+        # used from this one, so detection overlaps with tracking.
+        detect_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="detect")
+
+        # Decode, inference and sprite/JSON output run as three stages so
+        # that reading frame N+1 and pasting frame N-1 overlap with running
+        # the models on frame N. MediaPipe tasks are not thread-safe, so each
+        # one is only ever used from a single thread.
+
+        # Backends that accept several frames per call get micro-batches of
+        # the frames already decoded; MediaPipe runs one frame at a time.
+        batch_size = (
+            DETECTION_BATCH_SIZE if hasattr(self.detector, "detect_batch") else 1
+        )
 
-            if frame_idx % frame_interval != 0:
-                frame_idx += 1
-                self.processed_frames = frame_idx
-                progress = (frame_idx / self.frame_count) * 100
-                if progress_callback:
-                    progress_callback(progress)
-                continue
+        # RGB frame buffers are reused round-robin. A buffer must not be
+        # rewritten while its frame is still in use: at most two batches (one
+        # being detected, one being tracked), a full write queue and the
+        # frame the writer holds are alive at once.
+        self._rgb_ring = [None] * (2 * batch_size + PIPELINE_QUEUE_SIZE + 2)
+        self._rgb_next = 0
+
+        read_q = queue.Queue(maxsize=PIPELINE_QUEUE_SIZE)
+        write_q = queue.Queue(maxsize=PIPELINE_QUEUE_SIZE)
+        stop = threading.Event()
+        reader = threading.Thread(
+            target=self._read_frames,
+            args=(cap, frame_interval, read_q, stop, is_network_source(video_path)),
+            name="frame-reader",
+            daemon=True,
+        )
+        writer = threading.Thread(
+            target=self._write_frames,
+            args=(write_q,),
+            name="frame-writer",
+            daemon=True,
+        )
+        reader.start()
+        writer.start()
 
-            try:
-                timestamp = int(frame_idx * (1000 / fps))
-
-                # Ensure timestamp is monotonically increasing
-                if timestamp <= self.last_timestamp:
-                    timestamp = self.last_timestamp + 1
-                self.last_timestamp = timestamp
-
-                # Convert frame to RGB for MediaPipe
-                frame_rgb = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-
-                # Create MediaPipe Image
-                mp_image = mp.Image(image_format=mp.ImageFormat.SRGB, data=frame_rgb)
-
-                # Process frame
-                frame_results = self.detector.detect_for_video(mp_image, timestamp)
-
-                if frame_results.detections:
-                    self.frames_with_detections += 1
-                    frame_data = {
-                        "frame_idx": frame_idx,
-                        "timestamp": timestamp
-                        / 1000.0,  # Convert back to seconds for JSON
-                        "objects": [],
-                    }
-
-                    for detection in frame_results.detections:
-                        # Get bounding box
-                        bbox = detection.bounding_box
-                        x = int(bbox.origin_x)
-                        y = int(bbox.origin_y)
-                        w = int(bbox.width)
-                        h = int(bbox.height)
-
-                        # Get class and confidence
-                        category = detection.categories[0]
-                        class_name = category.category_name
-                        confidence = category.score
-
-                        # Track statistics
-                        self.detection_stats["total_detections"] += 1
-                        self.detection_stats["class_counts"][class_name] = (
-                            self.detection_stats["class_counts"].get(class_name, 0) + 1
+        try:
+            # Detection runs one batch ahead on detect_executor: while the
+            # detector works on batch N+1, this thread tracks batch N.
+            end_of_video = False
+            pending = None
+            while pending is not None or not end_of_video:
+                submitted = None
+                if not end_of_video:
+                    batch, end_of_video = self._take_batch(read_q, batch_size)
+                    if batch:
+                        frames, timestamps = self._prepare_batch(batch, ms_num, ms_den)
+                        future = detect_executor.submit(
+                            self._detect_with_motion_gate, frames, timestamps
                         )
-
-                        # Extract the detected object region
-                        object_region = frame[y : y + h, x : x + w]
-                        if object_region.size > 0:  # Check if region is valid
-                            # For person objects, check if they contain a face to improve accuracy
-                            if class_name == "person":
-                                self.detection_stats["person_detections"] += 1
-                                has_face = self.has_face(object_region)
-                                if not has_face:
-                                    self.detection_stats["person_without_face"] += 1
-                                    logger.debug(
-                                        f"Skipping person detection without face at frame {frame_idx}"
-                                    )
-                                    continue
-                                else:
-                                    self.detection_stats["person_with_face"] += 1
-                                    # If person has face, we can be more confident in the detection
-                                    # You could optionally boost confidence here
-                            else:
-                                self.detection_stats["other_detections"] += 1
-
-                            # Get embedding and track object for ALL classes
-                            embedding_result = self.tracker.get_embedding(object_region)
-                            obj_id = self.tracker.update(
-                                frame_idx, detection, embedding_result, bbox
-                            )
-
-                            # Only create a sprite thumbnail for the first sighting
-                            # of an object; reuse it for all future detections.
-                            # Use the full frame (not the cropped object region) so
-                            # the thumbnail is a complete screenshot; the bbox
-                            # remains in original video coordinates.
-                            if obj_id in self.object_sprite_refs:
-                                sprite_reference = self.object_sprite_refs[obj_id]
-                            else:
-                                fragment_id = self.sprite_generator.add_thumbnail(
-                                    frame, obj_id, frame_idx
-                                )
-                                sprite_reference = f"sprite.jpg{fragment_id}"  # Just filename + fragment
-                                self.object_sprite_refs[obj_id] = sprite_reference
-
-                            # Add object to frame data
-                            frame_data["objects"].append(
-                                {
-                                    "id": obj_id,
-                                    "class_name": class_name,
-                                    "confidence": float(confidence),
-                                    "bbox": {"x": x, "y": y, "width": w, "height": h},
-                                    "thumbnail": sprite_reference,
-                                }
-                            )
-
-                    # Only add frame to results if it has objects
-                    if frame_data["objects"]:
-                        self.results["frames"].append(frame_data)
-
-            except Exception as e:
-                logger.error(f"Error processing frame {frame_idx}: {str(e)}")
-                continue
-
-            frame_idx += 1
-            self.processed_frames = frame_idx
-
-            # Show progress percentage
-            progress = (frame_idx / self.frame_count) * 100
-            sys.stdout.write(f"\rProcessing: {progress:.1f}%")
-            sys.stdout.flush()
-            if progress_callback:
-                progress_callback(progress)
-
-        cap.release()
+                        submitted = (batch, frames, timestamps, future)
+
+                if pending is not None:
+                    self._track_batch(
+                        *pending,
+                        frame_interval,
+                        face_executor,
+                        write_q,
+                        progress_callback,
+                    )
+                pending = submitted
+        finally:
+            stop.set()
+            write_q.put(None)
+            writer.join()
+            reader.join()
+            cap.release()
+            detect_executor.shutdown()
+            face_executor.shutdown()
+
+        self._report_progress(self.processed_frames, progress_callback)
 
         # Save the sprite image to output_path
         import os
@@ -360,6 +717,29 @@ class ObjectDetector:
 
         return self.results
 
+    def save_results(self, output_path: str) -> None:
+        """
+        Write the results of process_video as JSON to output_path, streaming
+        the spooled frames into the "frames" list. The spool is closed
+        afterwards.
+        """
+        try:
+            with open(output_path, "w", encoding="utf-8") as f:
+                f.write("{")
+                for key, value in self.results.items():
+                    # Nested one level down: indent the value's lines by two
+                    body = json.dumps(value, indent=2).replace("\n", "\n  ")
+                    f.write(f"\n  {json.dumps(key)}: {body},")
+                f.write('\n  "frames": [')
+                self._frames_spool.seek(0)
+                for i, line in enumerate(self._frames_spool):
+                    f.write(",\n    " if i else "\n    ")
+                    f.write(line.rstrip("\n"))
+                f.write("\n  ]\n}\n")
+        finally:
+            self._frames_spool.close()
+            self._frames_spool = None
+
 
 def main():
     parser = argparse.ArgumentParser(description="Process video for object detection")
@@ -412,11 +792,10 @@ def main():
             similarity_threshold=args.similarity_threshold,
             analysis_fps=args.fps,
         )
-        results = detector.process_video(video_path, video_source_url=args.video_url)
+        detector.process_video(video_path, video_source_url=args.video_url)
 
         # Save results to JSON file
-        with open(args.output, "w") as f:
-            json.dump(results, f, indent=2)
+        detector.save_results(args.output)
 
         logger.info(f"Detection completed. Results saved to {args.output}")
 
@@ -1,5 +1,4 @@
 import os
-import json
 from typing import List, Optional, Tuple
 
 import cv2
@@ -11,6 +10,11 @@ from datetime import datetime
 from urllib.parse import urlparse
 from pydantic import BaseModel
 
+# Frames skipped between each frame the scene detectors analyse; skipped frames
+# are only grabbed, never retrieved or converted. Cuts move by at most this many
+# frames.
+SCENE_FRAME_SKIP = 1
+
 
 class SceneInfo(BaseModel):
     """Represents a single scene in the video"""
@@ -62,12 +66,12 @@ def detect_scenes_from_file(
     import traceback
 
     try:
-        video = open_video(video_path)
+        video = open_video(video_path, backend="opencv")
         scene_manager = SceneManager()
         scene_manager.add_detector(ContentDetector(threshold=threshold))
         scene_manager.add_detector(ThresholdDetector(threshold=12.0, min_scene_len=15))
 
-        scene_manager.detect_scenes(video=video)
+        scene_manager.detect_scenes(video=video, frame_skip=SCENE_FRAME_SKIP)
         scenes = scene_manager.get_scene_list()
         print(f"Detected {len(scenes)} scenes")
 
@@ -87,7 +91,8 @@ def detect_scenes_from_file(
                 cap.set(cv2.CAP_PROP_POS_FRAMES, frame_num)
                 ret, frame = cap.read()
                 if ret and frame is not None:
-                    generator.add_thumbnail(frame, f"scene_{scene_idx}", scene_idx)
+                    frame_rgb = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
+                    generator.add_thumbnail(frame_rgb, f"scene_{scene_idx}", scene_idx)
 
             cap.release()
 
@@ -185,7 +190,7 @@ def main():
 
     output_path = os.path.join(tmp_dir, f"scene_detection_{timestamp}.json")
     with open(output_path, "w") as f:
-        json.dump(results.model_dump() if results else None, f, indent=2)
+        f.write(results.model_dump_json(indent=2) if results else "null")
 
     print(f"Scene detection results saved to: {output_path}")
     return 0
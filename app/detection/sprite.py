@@ -3,7 +3,6 @@ from typing import Tuple
 
 import cv2
 import numpy as np
-from PIL import Image
 
 logger = logging.getLogger(__name__)
 
@@ -15,44 +14,45 @@ class SpriteGenerator:
         self.current_y = 0
         self.max_width = 1920  # Maximum width for sprite
         self.sprites = []
-        self.sprite_image = None
+        self.sprite_buf = None  # RGB canvas, converted to BGR only when saved
         self.actual_height = 0  # Track actual height used
 
     def add_thumbnail(self, image: np.ndarray, obj_id: str, frame_idx: int) -> str:
-        """Add a thumbnail to the sprite and return the fragment identifier"""
+        """Add an RGB image to the sprite and return the fragment identifier"""
         # Resize image to thumbnail size
-        thumbnail = cv2.resize(image, self.thumbnail_size)
-
-        # Convert BGR to RGB for PIL
-        thumbnail_rgb = cv2.cvtColor(thumbnail, cv2.COLOR_BGR2RGB)
-        pil_thumbnail = Image.fromarray(thumbnail_rgb)
+        thumbnail = cv2.resize(image, self.thumbnail_size, interpolation=cv2.INTER_AREA)
+        thumb_w, thumb_h = self.thumbnail_size
 
         # Check if we need to start a new row
-        if self.current_x + self.thumbnail_size[0] > self.max_width:
+        if self.current_x + thumb_w > self.max_width:
             self.current_x = 0
-            self.current_y += self.thumbnail_size[1]
+            self.current_y += thumb_h
 
         # Add thumbnail to sprite
-        if self.sprite_image is None:
-            # Create new sprite image with initial height
-            initial_height = self.thumbnail_size[1] * 10  # Start with 10 rows
-            self.sprite_image = Image.new(
-                "RGB", (self.max_width, initial_height), (255, 255, 255)
+        if self.sprite_buf is None:
+            # Start with a single row; the canvas doubles as rows are added,
+            # since there is one thumbnail per tracked object, not per frame
+            initial_height = thumb_h
+            self.sprite_buf = np.full(
+                (initial_height, self.max_width, 3), 255, dtype=np.uint8
             )
             self.actual_height = initial_height
 
         # Check if we need to expand the sprite height
-        required_height = self.current_y + self.thumbnail_size[1]
+        required_height = self.current_y + thumb_h
         if required_height > self.actual_height:
             # Create new larger sprite
             new_height = max(self.actual_height * 2, required_height)
-            new_sprite = Image.new("RGB", (self.max_width, new_height), (255, 255, 255))
-            new_sprite.paste(self.sprite_image, (0, 0))
-            self.sprite_image = new_sprite
+            new_sprite = np.full((new_height, self.max_width, 3), 255, dtype=np.uint8)
+            new_sprite[: self.actual_height] = self.sprite_buf
+            self.sprite_buf = new_sprite
             self.actual_height = new_height
 
         # Paste thumbnail at current position
-        self.sprite_image.paste(pil_thumbnail, (self.current_x, self.current_y))
+        self.sprite_buf[
+            self.current_y : self.current_y + thumb_h,
+            self.current_x : self.current_x + thumb_w,
+        ] = thumbnail
 
         # Create fragment identifier
         fragment_id = f"#xywh={self.current_x},{self.current_y},{self.thumbnail_size[0]},{self.thumbnail_size[1]}"
@@ -77,14 +77,13 @@ class SpriteGenerator:
 
     def save_sprite(self, output_path: str) -> None:
         """Save the sprite image as a JPEG file to output_path."""
-        if self.sprite_image is not None:
+        if self.sprite_buf is not None:
             # Crop the sprite to the actual used area
             actual_used_height = self.current_y + self.thumbnail_size[1]
-            if actual_used_height < self.actual_height:
-                self.sprite_image = self.sprite_image.crop(
-                    (0, 0, self.max_width, actual_used_height)
-                )
-            self.sprite_image.save(output_path, format="JPEG", quality=50)
+            sprite = cv2.cvtColor(
+                self.sprite_buf[:actual_used_height], cv2.COLOR_RGB2BGR
+            )
+            cv2.imwrite(output_path, sprite, [cv2.IMWRITE_JPEG_QUALITY, 50])
             logger.info(
-                f"Sprite saved to: {output_path} (dimensions: {self.sprite_image.size})"
+                f"Sprite saved to: {output_path} (dimensions: {(sprite.shape[1], sprite.shape[0])})"
             )
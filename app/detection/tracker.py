@@ -1,49 +1,131 @@
 import logging
-from typing import Any, Dict, Tuple
+from typing import Any, Dict, List, Optional, Tuple
 
-import cv2
 import mediapipe as mp
 import numpy as np
-from mediapipe.tasks import python
 from mediapipe.tasks.python import vision
 
-from app.detection.models import get_model_path
+from app.detection._numeric import iou_batch
+from app.detection.models import create_task
 
 logger = logging.getLogger(__name__)
 
+# Minimum IoU with a recently updated object of the same class for a detection
+# to be attributed to it without computing an embedding.
+IOU_MATCH_THRESHOLD = 0.7
+
+# Objects seen within this many frames are tried first when matching by
+# embedding. scale_windows replaces it with RECENT_MATCH_SECONDS of video, and
+# at least RECENT_MATCH_MIN_SAMPLES analysed frames; both are well below the
+# idle window below, so the older objects form a real second pass.
+RECENT_MATCH_FRAMES = 150
+RECENT_MATCH_SECONDS = 5
+RECENT_MATCH_MIN_SAMPLES = 2
+
+# Initial number of rows of the embedding matrix and detection log; they
+# double when full
+INITIAL_CAPACITY = 64
+
+# Tracked objects not seen for this many frames are archived: they are kept
+# for the JSON output but no longer matched against. scale_windows replaces
+# it with MAX_IDLE_SECONDS of video, and at least MAX_IDLE_MIN_SAMPLES
+# analysed frames when frames are sampled sparsely.
+MAX_IDLE_FRAMES = 1500
+MAX_IDLE_SECONDS = 60
+MAX_IDLE_MIN_SAMPLES = 10
+
+# Idle objects are looked for at most once per this many frames
+EVICTION_INTERVAL = 100
+
+# One record per tracked detection, "object" being the object's position in
+# creation order (rows of the arrays below change when objects are archived)
+DETECTION_DTYPE = np.dtype(
+    [
+        ("object", np.int32),
+        ("frame_idx", np.int64),
+        ("confidence", np.float32),
+        ("similarity", np.float32),
+        ("x", np.int32),
+        ("y", np.int32),
+        ("width", np.int32),
+        ("height", np.int32),
+    ]
+)
+
+
+def _int8_vector(embedding_result: Any) -> np.ndarray:
+    """int8 view of a quantized embedder result (no copy)"""
+    # Quantized embeddings are int8 values stored as raw bytes
+    return embedding_result.embeddings[0].embedding.view(np.int8)
+
 
 class ObjectTracker:
     def __init__(
-        self, similarity_threshold: float = 0.5
+        self,
+        similarity_threshold: float = 0.5,
+        use_gpu: bool = True,
+        max_idle_frames: int = MAX_IDLE_FRAMES,
+        recent_match_frames: int = RECENT_MATCH_FRAMES,
     ):  # Lowered threshold significantly
         self.similarity_threshold = similarity_threshold
+        self.max_idle_frames = max_idle_frames
+        self.recent_match_frames = recent_match_frames
         self.tracked_objects: Dict[str, Dict] = {}
+        self.archived_objects: Dict[str, Dict] = {}  # Idle, no longer matched
         self.class_counters = {}  # Separate counter for each class
+        self._last_eviction = 0
+
+        # Parallel arrays, one row per tracked object, so candidates can be
+        # filtered by class and scored with a single matrix product. Only the
+        # first len(self._ids) rows are in use; the rest is spare capacity.
+        # Embeddings are kept as the embedder's int8 values with their norms.
+        self._ids: List[str] = []
+        self._rows: Dict[str, int] = {}
+        self._classes = np.empty(0, dtype=object)
+        self._emb_mat = np.empty((0, 0), dtype=np.int8)
+        self._norms = np.empty(0, dtype=np.float32)
+        self._boxes = np.empty((0, 4), dtype=np.float64)  # last (x, y, w, h)
+        self._last_frames = np.empty(0, dtype=np.int64)
+        # Embedding similarity of each object's last embedding match, carried
+        # over to the detections attributed by box overlap
+        self._similarities = np.empty(0, dtype=np.float32)
+
+        # Detections of all objects as records instead of a list of dicts per
+        # object; dicts are only built by get_tracked_objects_for_json
+        self._object_keys: Dict[str, int] = {}  # obj_id -> creation order
+        self._detections = np.empty(INITIAL_CAPACITY, dtype=DETECTION_DTYPE)
+        self._detection_count = 0
 
         # Initialize MediaPipe Image Embedder
         logger.info(
             "Initializing Object Tracker with similarity threshold: %s",
             similarity_threshold,
         )
-        model_path = get_model_path("embedder")
-        base_options = python.BaseOptions(model_asset_path=model_path)
-        options = vision.ImageEmbedderOptions(
-            base_options=base_options, l2_normalize=True, quantize=True
+        self.embedder = create_task(
+            vision.ImageEmbedder,
+            "embedder",
+            lambda base_options: vision.ImageEmbedderOptions(
+                base_options=base_options, l2_normalize=True, quantize=True
+            ),
+            use_gpu,
+        )
+
+    def scale_windows(self, fps: float, frame_interval: int) -> None:
+        """Size the matching windows for a video analysed every frame_interval frames"""
+        self.recent_match_frames = max(
+            int(round(RECENT_MATCH_SECONDS * fps)),
+            RECENT_MATCH_MIN_SAMPLES * frame_interval,
+        )
+        self.max_idle_frames = max(
+            int(round(MAX_IDLE_SECONDS * fps)), MAX_IDLE_MIN_SAMPLES * frame_interval
         )
-        self.embedder = vision.ImageEmbedder.create_from_options(options)
 
     def get_embedding(self, image: np.ndarray) -> Any:
-        """Get embedding for an image"""
-        # Convert to RGB if needed
-        if len(image.shape) == 2:
-            image = cv2.cvtColor(image, cv2.COLOR_GRAY2RGB)
-        elif image.shape[2] == 4:
-            image = cv2.cvtColor(image, cv2.COLOR_BGRA2RGB)
-        elif image.shape[2] == 3:
-            image = cv2.cvtColor(image, cv2.COLOR_BGR2RGB)
-
-        # Create MediaPipe Image
-        mp_image = mp.Image(image_format=mp.ImageFormat.SRGB, data=image)
+        """Get embedding for an RGB image"""
+        # Crops are views into the frame; MediaPipe needs contiguous data
+        mp_image = mp.Image(
+            image_format=mp.ImageFormat.SRGB, data=np.ascontiguousarray(image)
+        )
 
         # Get embedding
         return self.embedder.embed(mp_image)
@@ -52,49 +134,129 @@ class ObjectTracker:
         self, embedding_result: Any, class_name: str, bbox: Any, frame_idx: int
     ) -> Tuple[str, float]:
         """Find the most similar tracked object of the same class"""
-        if not self.tracked_objects:
-            return None, 0.0
-
-        best_match_id = None
-        best_similarity = 0.0
-
-        for obj_id, obj in self.tracked_objects.items():
-            if obj["class"] != class_name:
-                continue
+        return self._find_similar_vector(
+            _int8_vector(embedding_result), class_name, frame_idx
+        )
 
-            # Calculate embedding similarity only
-            embedding_similarity = vision.ImageEmbedder.cosine_similarity(
-                embedding_result.embeddings[0], obj["embedding"].embeddings[0]
-            )
+    def _find_similar_vector(
+        self, vector: np.ndarray, class_name: str, frame_idx: int
+    ) -> Tuple[Optional[str], float]:
+        """
+        Find a tracked object of the same class similar to an int8 vector.
 
-            logger.debug(f"Comparing with {obj_id}: emb={embedding_similarity:.3f}")
+        Objects seen in the last recent_match_frames frames are scored first;
+        the older ones are only scored when none of the recent ones is similar
+        enough, so a recent match wins over a slightly better old one.
+        """
+        count = len(self._ids)
+        same_class = self._classes[:count] == class_name
+        recent = same_class & (
+            self._last_frames[:count] >= frame_idx - self.recent_match_frames
+        )
 
-            if embedding_similarity > best_similarity:
-                best_similarity = embedding_similarity
-                best_match_id = obj_id
+        best_match_id, best_similarity = None, 0.0
+        for candidates in (
+            np.flatnonzero(recent),
+            np.flatnonzero(same_class & ~recent),
+        ):
+            if candidates.size == 0:
+                continue
+            match_id, similarity = self._best_match(vector, candidates)
+            if similarity > best_similarity:
+                best_match_id, best_similarity = match_id, similarity
 
-        if best_similarity >= self.similarity_threshold:
-            logger.debug(
-                f"Found similar object: {best_match_id} with similarity {best_similarity:.3f}"
-            )
-            return best_match_id, best_similarity
+            if best_similarity > 0.0 and best_similarity >= self.similarity_threshold:
+                logger.debug(
+                    f"Found similar object: {best_match_id} with similarity {best_similarity:.3f}"
+                )
+                return best_match_id, best_similarity
 
         logger.debug(
             f"No similar object found. Max similarity: {best_similarity:.3f} (threshold: {self.similarity_threshold})"
         )
         return None, best_similarity
 
+    def _best_match(
+        self, vector: np.ndarray, candidates: np.ndarray
+    ) -> Tuple[str, float]:
+        """The candidate row most similar to an int8 vector, and its similarity"""
+        # Exact cosine similarity: int32-accumulated int8 dot products
+        # divided by the cached row norms and the query norm
+        query = vector.astype(np.int32)
+        dots = self._emb_mat[candidates] @ query
+        denom = self._norms[candidates] * np.sqrt(float(query @ query))
+        scores = np.divide(
+            dots, denom, out=np.zeros(dots.shape, dtype=np.float64), where=denom > 0
+        )
+        best = int(np.argmax(scores))
+        return self._ids[candidates[best]], max(float(scores[best]), 0.0)
+
+    def find_overlapping_object(
+        self, class_name: str, bbox: Any, frame_idx: int, max_frame_gap: int
+    ) -> Tuple[Optional[str], float]:
+        """Find a recently updated object of the same class whose last box overlaps bbox"""
+        box = (bbox.origin_x, bbox.origin_y, bbox.width, bbox.height)
+        count = len(self._ids)
+        candidates = np.flatnonzero(
+            (self._classes[:count] == class_name)
+            & (self._last_frames[:count] >= frame_idx - max_frame_gap)
+        )
+        if candidates.size == 0:
+            return None, 0.0
+
+        ious = iou_batch(self._boxes[candidates], box)
+        best = int(np.argmax(ious))
+        best_iou = float(ious[best])
+        best_match_id = self._ids[candidates[best]]
+
+        if best_iou > IOU_MATCH_THRESHOLD:
+            return best_match_id, best_iou
+        return None, best_iou
+
+    def update_by_id(
+        self, obj_id: str, frame_idx: int, detection: Any, bbox: Any, iou: float
+    ) -> str:
+        """
+        Append a detection to an already tracked object, keeping its embedding.
+
+        The detection's similarity is the object's last embedding similarity,
+        not the IoU, which is only logged.
+        """
+        logger.debug(f"Updating {obj_id} by bbox overlap (iou: {iou:.3f})")
+        similarity = float(self._similarities[self._rows[obj_id]])
+        self._append_detection(
+            obj_id, frame_idx, detection.categories[0].score, similarity, bbox
+        )
+        # Only once the object is marked as seen, so it cannot be archived
+        self._maybe_evict(frame_idx)
+        return obj_id
+
+    def needs_face_check(
+        self, obj_id: Optional[str], frame_idx: int, max_age: int
+    ) -> bool:
+        """Whether a detection matched to obj_id (if any) still needs a face check"""
+        obj = self.tracked_objects.get(obj_id) if obj_id is not None else None
+        if obj is None or not obj["face_confirmed"]:
+            return True
+        return frame_idx - obj["last_face_check_frame"] >= max_age
+
+    def record_face_check(self, obj_id: str, frame_idx: int, has_face: bool) -> None:
+        """Cache the result of a face check on a tracked object"""
+        obj = self.tracked_objects[obj_id]
+        obj["face_confirmed"] = has_face
+        obj["last_face_check_frame"] = frame_idx
+
     def update(
         self, frame_idx: int, detection: Any, embedding_result: Any, bbox: Any
     ) -> str:
         """Update tracked objects with new detection"""
+        self._maybe_evict(frame_idx)
         class_name = detection.categories[0].category_name
         confidence = detection.categories[0].score
 
         # Find similar object of the same class
-        obj_id, similarity = self.find_similar_object(
-            embedding_result, class_name, bbox, frame_idx
-        )
+        vector = _int8_vector(embedding_result)
+        obj_id, similarity = self._find_similar_vector(vector, class_name, frame_idx)
 
         if obj_id is None:
             # New object of this class
@@ -103,44 +265,147 @@ class ObjectTracker:
             obj_id = f"{class_name}_{self.class_counters[class_name]}"
             self.class_counters[class_name] += 1
 
+            self._object_keys[obj_id] = len(self._object_keys)
             self.tracked_objects[obj_id] = {
                 "class": class_name,
-                "embedding": embedding_result,
                 "first_detection": frame_idx,
-                "detections": [],
+                "face_confirmed": False,
+                "last_face_check_frame": -1,
             }
         else:
             logger.debug(
                 f"Updating existing {class_name}: {obj_id} (similarity: {similarity:.3f})"
             )
 
-        # Update object data
-        detection_data = {
-            "frame_idx": frame_idx,
-            "confidence": float(confidence),
-            "similarity": float(similarity),
-            "bbox": {
-                "x": bbox.origin_x,
-                "y": bbox.origin_y,
-                "width": bbox.width,
-                "height": bbox.height,
-            },
-        }
-
-        self.tracked_objects[obj_id]["detections"].append(detection_data)
-
         # Update the embedding to the latest one for better future matching
-        self.tracked_objects[obj_id]["embedding"] = embedding_result
+        self._store_embedding(obj_id, class_name, vector)
+        self._similarities[self._rows[obj_id]] = similarity
+
+        self._append_detection(obj_id, frame_idx, confidence, similarity, bbox)
 
         return obj_id
 
+    def _store_embedding(
+        self, obj_id: str, class_name: str, vector: np.ndarray
+    ) -> None:
+        """Set the embedding row of an object, appending a row for new objects"""
+        wide = vector.astype(np.int32)
+        norm = np.sqrt(float(wide @ wide))
+        row = self._rows.get(obj_id)
+        if row is not None:
+            self._emb_mat[row] = vector
+            self._norms[row] = norm
+            return
+
+        row = len(self._ids)
+        if row == len(self._emb_mat):
+            # Full (or first object): grow by doubling instead of reallocating
+            # the whole matrix on every new object
+            capacity = max(2 * row, INITIAL_CAPACITY)
+            emb_mat = np.empty((capacity, vector.shape[0]), dtype=np.int8)
+            norms = np.empty(capacity, dtype=np.float32)
+            classes = np.empty(capacity, dtype=object)
+            boxes = np.empty((capacity, 4), dtype=np.float64)
+            last_frames = np.empty(capacity, dtype=np.int64)
+            similarities = np.empty(capacity, dtype=np.float32)
+            if row:
+                emb_mat[:row] = self._emb_mat
+                norms[:row] = self._norms
+                classes[:row] = self._classes
+                boxes[:row] = self._boxes
+                last_frames[:row] = self._last_frames
+                similarities[:row] = self._similarities
+            self._emb_mat, self._norms, self._classes = emb_mat, norms, classes
+            self._boxes, self._last_frames = boxes, last_frames
+            self._similarities = similarities
+
+        self._rows[obj_id] = row
+        self._ids.append(obj_id)
+        self._classes[row] = class_name
+        self._emb_mat[row] = vector
+        self._norms[row] = norm
+
+    def _append_detection(
+        self,
+        obj_id: str,
+        frame_idx: int,
+        confidence: float,
+        similarity: float,
+        bbox: Any,
+    ) -> None:
+        """Record a detection and the last known box of a tracked object"""
+        row = self._rows[obj_id]
+        key = self._object_keys[obj_id]
+        box = (bbox.origin_x, bbox.origin_y, bbox.width, bbox.height)
+
+        count = self._detection_count
+        if count == len(self._detections):
+            detections = np.empty(2 * count, dtype=DETECTION_DTYPE)
+            detections[:count] = self._detections
+            self._detections = detections
+        self._detections[count] = (key, frame_idx, confidence, similarity) + box
+        self._detection_count = count + 1
+
+        self._boxes[row] = box
+        self._last_frames[row] = frame_idx
+
+    def _maybe_evict(self, frame_idx: int) -> None:
+        """Archive objects idle for more than max_idle_frames, every EVICTION_INTERVAL frames"""
+        if frame_idx - self._last_eviction < EVICTION_INTERVAL:
+            return
+        self._last_eviction = frame_idx
+
+        count = len(self._ids)
+        idle = self._last_frames[:count] < frame_idx - self.max_idle_frames
+        if not idle.any():
+            return
+
+        for row in np.flatnonzero(idle):
+            obj_id = self._ids[row]
+            self.archived_objects[obj_id] = self.tracked_objects.pop(obj_id)
+
+        # Compact the arrays so only active objects are scanned
+        keep = np.flatnonzero(~idle)
+        kept = len(keep)
+        for values in (
+            self._classes,
+            self._emb_mat,
+            self._norms,
+            self._boxes,
+            self._last_frames,
+            self._similarities,
+        ):
+            values[:kept] = values[keep]
+        self._ids = [self._ids[row] for row in keep]
+        self._rows = {obj_id: row for row, obj_id in enumerate(self._ids)}
+        logger.debug(f"Archived {count - kept} idle objects at frame {frame_idx}")
+
     def get_tracked_objects_for_json(self) -> Dict[str, Dict]:
-        """Get tracked objects without embeddings for JSON output"""
+        """Get tracked and archived objects without embeddings for JSON output"""
+        log = self._detections[: self._detection_count]
+        # Group the log by object, keeping detections in frame order
+        log = log[np.argsort(log["object"], kind="stable")]
+        bounds = np.searchsorted(log["object"], np.arange(len(self._object_keys) + 1))
+
         json_objects = {}
-        for obj_id, obj in self.tracked_objects.items():
+        for obj_id, key in self._object_keys.items():
+            obj = self.tracked_objects.get(obj_id) or self.archived_objects[obj_id]
             json_objects[obj_id] = {
                 "class": obj["class"],
                 "first_detection": obj["first_detection"],
-                "detections": obj["detections"],
+                "detections": [
+                    {
+                        "frame_idx": int(d["frame_idx"]),
+                        "confidence": float(d["confidence"]),
+                        "similarity": float(d["similarity"]),
+                        "bbox": {
+                            "x": int(d["x"]),
+                            "y": int(d["y"]),
+                            "width": int(d["width"]),
+                            "height": int(d["height"]),
+                        },
+                    }
+                    for d in log[bounds[key] : bounds[key + 1]]
+                ],
             }
         return json_objects
@@ -1,20 +1,33 @@
 """Main FastAPI application"""
 
-import json
+import asyncio
+import gzip
+import mimetypes
 import os
 import logging
 from contextlib import asynccontextmanager
 
-from fastapi import FastAPI
+import orjson
+import redis.asyncio as aioredis
+from fastapi import FastAPI, Request, Response
+from fastapi.responses import HTMLResponse, ORJSONResponse
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.openapi.docs import (
+    get_redoc_html,
+    get_swagger_ui_html,
+    get_swagger_ui_oauth2_redirect_html,
+)
 from fastapi.staticfiles import StaticFiles
+from starlette.datastructures import Headers
+from starlette.responses import FileResponse
+from starlette.staticfiles import NotModifiedResponse
 from scalar_fastapi import get_scalar_api_reference
 from pydantic import BaseModel
 from datetime import datetime
 
 from app.api.routes import router
-from app.core.dependencies import job_manager
-from app.core.utils import get_version, get_log_level
+from app.core.dependencies import async_redis_pool, job_manager, redis_pool
+from app.core.utils import get_version, get_log_level, make_etag
 
 # Set up logging (level from LOG_LEVEL env, default INFO)
 logging.basicConfig(level=get_log_level())
@@ -34,22 +47,40 @@ async def lifespan(app: FastAPI):
     # Create output directory
     os.makedirs("outputs", exist_ok=True)
 
-    # Test Redis connection
+    # Test Redis connection without blocking the event loop
+    app.state.redis_pool = redis_pool
+    app.state.aioredis = aioredis.Redis(connection_pool=async_redis_pool)
     try:
-        job_manager.ping()
+        await app.state.aioredis.ping()
         logger.info("Connected to Redis")
     except Exception as e:
         logger.error(f"Failed to connect to Redis: {str(e)}")
-        raise
 
     # Clean up stale jobs
-    job_manager.cleanup_stale_jobs()
+    await asyncio.to_thread(job_manager.cleanup_stale_jobs)
+
+    # Build the OpenAPI schema once; /openapi.json serves these bytes
+    schema = app.openapi()
+    app.state.openapi_bytes = orjson.dumps(schema)
+    app.state.openapi_gzip = gzip.compress(
+        app.state.openapi_bytes, compresslevel=OPENAPI_GZIP_LEVEL
+    )
+    app.state.openapi_etag = make_etag(app.state.openapi_bytes)
+    app.state.openapi_gzip_etag = make_etag(app.state.openapi_gzip)
+    # The docs page only depends on the schema URL and title
+    app.state.scalar_html = get_scalar_api_reference(
+        openapi_url=OPENAPI_URL,
+        title=app.title,
+    ).body
 
     # Save OpenAPI schema to file
     openapi_path = os.getenv("OPENAPI_JSON_PATH", "openapi.json")
     try:
-        with open(openapi_path, "w") as f:
-            json.dump(app.openapi(), f, indent=2)
+        with open(openapi_path, "wb", buffering=65536) as f:
+            f.write(orjson.dumps(schema, option=orjson.OPT_INDENT_2))
+        # Pre-compressed copy for proxies serving the file by Accept-Encoding
+        with open(openapi_path + ".gz", "wb") as f:
+            f.write(app.state.openapi_gzip)
         logger.info("OpenAPI schema saved to %s", openapi_path)
     except Exception as e:
         logger.warning("Failed to save OpenAPI schema: %s", e)
@@ -58,6 +89,9 @@ async def lifespan(app: FastAPI):
 
     # Shutdown
     logger.info("Shutting down FastAPI web service...")
+    await app.state.aioredis.aclose()
+    await async_redis_pool.disconnect()
+    redis_pool.disconnect()
 
 
 tags_metadata = [
@@ -90,8 +124,19 @@ app = FastAPI(
     lifespan=lifespan,
     openapi_tags=tags_metadata,
     root_path="/",
+    # Served by openapi_json below from the schema serialised at startup;
+    # this also disables the built-in docs pages, registered below instead
+    openapi_url=None,
+    default_response_class=ORJSONResponse,
 )
 
+OPENAPI_URL = "/openapi.json"
+DOCS_URL = "/docs"
+SWAGGER_UI_OAUTH2_REDIRECT_URL = "/docs/oauth2-redirect"
+REDOC_URL = "/redoc"
+# Compression level of the pre-compressed OpenAPI schema
+OPENAPI_GZIP_LEVEL = 6
+
 # Enable CORS
 app.add_middleware(
     CORSMiddleware,
@@ -104,8 +149,31 @@ app.add_middleware(
 # Include API routes
 app.include_router(router)
 
+
+class PrecompressedStaticFiles(StaticFiles):
+    """StaticFiles that serves a file's .gz sibling to clients accepting gzip"""
+
+    def file_response(self, full_path, stat_result, scope, status_code=200):
+        request_headers = Headers(scope=scope)
+        gz_path = f"{full_path}.gz"
+        accepts_gzip = "gzip" in request_headers.get("accept-encoding", "")
+        if not accepts_gzip or not os.path.isfile(gz_path):
+            return super().file_response(full_path, stat_result, scope, status_code)
+
+        response = FileResponse(
+            gz_path,
+            status_code=status_code,
+            stat_result=os.stat(gz_path),
+            media_type=mimetypes.guess_type(str(full_path))[0] or "text/plain",
+            headers={"Content-Encoding": "gzip", "Vary": "Accept-Encoding"},
+        )
+        if self.is_not_modified(response.headers, request_headers):
+            return NotModifiedResponse(response.headers)
+        return response
+
+
 # Serve the outputs directory as static files
-app.mount("/outputs", StaticFiles(directory="outputs"), name="outputs")
+app.mount("/outputs", PrecompressedStaticFiles(directory="outputs"), name="outputs")
 
 
 # Webhook model for documentation
@@ -125,10 +193,48 @@ def job_completed(body: JobCompletedWebhook):
     """
 
 
+@app.get(OPENAPI_URL, include_in_schema=False)
+async def openapi_json(request: Request):
+    """OpenAPI schema"""
+    if "gzip" in request.headers.get("accept-encoding", ""):
+        content = app.state.openapi_gzip
+        headers = {
+            "Content-Encoding": "gzip",
+            "ETag": app.state.openapi_gzip_etag,
+            "Vary": "Accept-Encoding",
+        }
+    else:
+        content = app.state.openapi_bytes
+        headers = {"ETag": app.state.openapi_etag, "Vary": "Accept-Encoding"}
+
+    if request.headers.get("if-none-match") == headers["ETag"]:
+        return Response(status_code=304, headers=headers)
+    return Response(content=content, media_type="application/json", headers=headers)
+
+
 @app.get("/", include_in_schema=False)
 async def scalar_html():
     """API documentation"""
-    return get_scalar_api_reference(
-        openapi_url=app.openapi_url,
-        title=app.title,
+    return HTMLResponse(app.state.scalar_html)
+
+
+@app.get(DOCS_URL, include_in_schema=False)
+async def swagger_ui_html():
+    """Swagger UI"""
+    return get_swagger_ui_html(
+        openapi_url=OPENAPI_URL,
+        title=f"{app.title} - Swagger UI",
+        oauth2_redirect_url=SWAGGER_UI_OAUTH2_REDIRECT_URL,
     )
+
+
+@app.get(SWAGGER_UI_OAUTH2_REDIRECT_URL, include_in_schema=False)
+async def swagger_ui_redirect():
+    """Swagger UI OAuth2 redirect"""
+    return get_swagger_ui_oauth2_redirect_html()
+
+
+@app.get(REDOC_URL, include_in_schema=False)
+async def redoc_html():
+    """ReDoc"""
+    return get_redoc_html(openapi_url=OPENAPI_URL, title=f"{app.title} - ReDoc")
@@ -1,6 +1,7 @@
 import ipaddress
 import os
 from enum import Enum
+from functools import lru_cache
 from typing import Annotated, Literal, Optional, Union
 from urllib.parse import urlparse
 
@@ -24,9 +25,15 @@ class JobType(str, Enum):
     scene_detect = "scene_detect"
 
 
-def _validate_video_url(v: str) -> str:
+@lru_cache(maxsize=4096)
+def _is_http_url(v: str) -> bool:
     result = urlparse(v)
-    if (result.scheme in ("http", "https") and result.netloc) or os.path.exists(v):
+    return result.scheme in ("http", "https") and bool(result.netloc)
+
+
+def _validate_video_url(v: str) -> str:
+    # Only non-HTTP values need the filesystem check
+    if _is_http_url(v) or os.path.exists(v):
         return v
     raise ValueError("video_url must be a valid URL or an existing file path")
 
@@ -1,50 +1,43 @@
+import sys
+from dataclasses import dataclass, field
 from typing import List, Dict, Optional, Any
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 from datetime import datetime
 
-
-# --- Type definitions for detection results ---
-class BoundingBox(BaseModel):
-    x: int
-    y: int
-    width: int
-    height: int
-
-
-class DetectionObject(BaseModel):
-    id: str
-    class_name: str
-    confidence: float
-    bbox: BoundingBox
-    thumbnail: str
+from app.models.result_models import (
+    BoundingBoxModel,
+    DetectionFrameModel,
+    DetectionObjectModel,
+    VideoMetadataModel,
+)
 
 
-class DetectionFrame(BaseModel):
-    frame_idx: int
-    timestamp: float
-    objects: List[DetectionObject]
+# --- Type definitions for detection results ---
+# Shapes shared with the API result models reuse those classes
+BoundingBox = BoundingBoxModel
+DetectionObject = DetectionObjectModel
+DetectionFrame = DetectionFrameModel
+VideoMetadata = VideoMetadataModel
 
 
-class VideoMetadata(BaseModel):
-    fps: float
-    frame_count: int
-    width: int
-    height: int
-    source: str
+class _DeferredModel(BaseModel):
+    # Only used as type annotations for the detector output, so the core
+    # schema is built on first validation rather than at import
+    model_config = ConfigDict(defer_build=True)
 
 
-class ModelMetadata(BaseModel):
+class ModelMetadata(_DeferredModel):
     name: str
     type: str
     version: str
 
 
-class SpriteMetadata(BaseModel):
+class SpriteMetadata(_DeferredModel):
     path: str
     thumbnail_size: List[int]
 
 
-class DetectionStatistics(BaseModel):
+class DetectionStatistics(_DeferredModel):
     total_detections: int
     person_detections: int
     person_with_face: int
@@ -53,7 +46,7 @@ class DetectionStatistics(BaseModel):
     class_counts: Dict[str, int]
 
 
-class ProcessingMetadata(BaseModel):
+class ProcessingMetadata(_DeferredModel):
     start_time: str
     end_time: str
     duration_seconds: float
@@ -63,40 +56,48 @@ class ProcessingMetadata(BaseModel):
     detection_statistics: DetectionStatistics
 
 
-class ResultsMetadata(BaseModel):
+class ResultsMetadata(_DeferredModel):
     video: VideoMetadata
     model: ModelMetadata
     sprite: SpriteMetadata
     processing: ProcessingMetadata
 
 
-class DetectionResults(BaseModel):
+class DetectionResults(_DeferredModel):
     version: str
     metadata: ResultsMetadata
     frames: List[DetectionFrame]
 
 
+# Valid JobStatus.status values, interned so every job shares the same objects
+JOB_STATUSES = {
+    status: sys.intern(status)
+    for status in ("queued", "processing", "completed", "failed")
+}
+
+
+@dataclass(slots=True)
 class JobStatus:
-    def __init__(
-        self,
-        job_id: str,
-        external_id: str,
-        video_url: str,
-        job_type: str = "object_detect",
-        callback_url: str = None,
-        params: Optional[Dict[str, Any]] = None,
-    ):
-        self.job_id = job_id
-        self.external_id = external_id
-        self.video_url = video_url
-        self.job_type = job_type
-        self.callback_url = callback_url
-        self.params: Dict[str, Any] = params or {}
-        self.status = "queued"  # queued, processing, completed, failed
-        self.start_time: Optional[datetime] = None
-        self.end_time: Optional[datetime] = None
-        self.progress = 0.0
-        self.result_path: Optional[str] = None
-        self.error_message: Optional[str] = None
-        self.metadata: Dict[str, Any] = {}
-        self.queue_position = 0
+    job_id: str
+    external_id: str
+    video_url: str
+    job_type: str = "object_detect"
+    callback_url: Optional[str] = None
+    params: Optional[Dict[str, Any]] = None
+    # queued, processing, completed, failed
+    status: str = field(default="queued", init=False)
+    start_time: Optional[datetime] = field(default=None, init=False)
+    end_time: Optional[datetime] = field(default=None, init=False)
+    progress: float = field(default=0.0, init=False)
+    result_path: Optional[str] = field(default=None, init=False)
+    error_message: Optional[str] = field(default=None, init=False)
+    metadata: Dict[str, Any] = field(default_factory=dict, init=False)
+    queue_position: int = field(default=0, init=False)
+
+    def __post_init__(self):
+        if self.params is None:
+            self.params = {}
+
+    def set_status(self, status: str) -> None:
+        """Set the status; raises KeyError for anything but JOB_STATUSES."""
+        self.status = JOB_STATUSES[status]
@@ -12,9 +12,13 @@ Environment variables consumed by the tests:
 
 import os
 import time
+import uuid
+from types import MappingProxyType
 
 import pytest
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 BASE_URL = os.getenv("BASE_URL", "http://localhost:8081")
 API_KEY = os.getenv("API_KEY", "test-key-for-ci")
@@ -22,56 +26,103 @@ HEADERS_AUTH = {"x-api-key": API_KEY}
 HEADERS_JSON_AUTH = {"Content-Type": "application/json", "x-api-key": API_KEY}
 FAKE_JOB_ID = "00000000-0000-0000-0000-000000000000"
 
+# Endpoint URLs, built once
+DOCS_URL = f"{BASE_URL}/"
+HEALTH_URL = f"{BASE_URL}/health"
+CREATE_JOB_URL = f"{BASE_URL}/job/create"
+STATUS_URL = f"{BASE_URL}/status"
+FAKE_STATUS_URL = f"{STATUS_URL}/{FAKE_JOB_ID}"
+FAKE_RESULTS_URL = f"{BASE_URL}/job/{FAKE_JOB_ID}/results"
+
+# Read-only base payloads; tests build requests as overrides of these
+OBJECT_DETECT_PAYLOAD = MappingProxyType(
+    {
+        "job_type": "object_detect",
+        "external_id": "ci-test-project",
+        "video_url": "http://example.com/video.mp4",
+        "params": {"similarity_threshold": 0.5},
+    }
+)
+SCENE_DETECT_PAYLOAD = MappingProxyType(
+    {
+        "job_type": "scene_detect",
+        "external_id": "ci-test-project-scene",
+        "video_url": "http://example.com/video.mp4",
+        "params": {"threshold": 30.0},
+    }
+)
+
 
 # ---------------------------------------------------------------------------
 # Helpers
 # ---------------------------------------------------------------------------
 
 
-def _wait_for_api(max_wait: int = 60) -> None:
-    """Block until /health returns 200 or timeout is reached."""
+def _wait_for_api(http=requests, max_wait: int = 60) -> None:
+    """Block until /health returns 200 or timeout is reached.
+
+    http may be a requests.Session so the probe's connection is kept for the
+    tests that follow.
+    """
     deadline = time.time() + max_wait
+    delay = 0.1
     while time.time() < deadline:
         try:
-            r = requests.get(f"{BASE_URL}/health", timeout=5)
+            r = http.get(HEALTH_URL, timeout=5)
             if r.status_code == 200:
                 return
         except requests.exceptions.ConnectionError:
             pass
-        time.sleep(2)
+        time.sleep(delay)
+        delay = min(delay * 2, 2.0)
     pytest.fail(f"API at {BASE_URL} did not become ready within {max_wait}s")
 
 
 def _object_detect_payload(**overrides) -> dict:
-    base = {
-        "job_type": "object_detect",
-        "external_id": "ci-test-project",
-        "video_url": "http://example.com/video.mp4",
-        "params": {"similarity_threshold": 0.5},
-    }
-    base.update(overrides)
-    return base
+    return {**OBJECT_DETECT_PAYLOAD, **overrides}
 
 
 def _scene_detect_payload(**overrides) -> dict:
-    base = {
-        "job_type": "scene_detect",
-        "external_id": "ci-test-project-scene",
-        "video_url": "http://example.com/video.mp4",
-        "params": {"threshold": 30.0},
-    }
-    base.update(overrides)
-    return base
+    return {**SCENE_DETECT_PAYLOAD, **overrides}
 
 
 # ---------------------------------------------------------------------------
-# Session-scoped fixture: wait for the API to be up
+# Session-scoped fixtures: wait for the API, share one HTTP session
 # ---------------------------------------------------------------------------
 
 
+@pytest.fixture(scope="session")
+def session():
+    """Keep-alive HTTP session shared by every test in the worker."""
+    adapter = HTTPAdapter(
+        pool_connections=16,
+        pool_maxsize=16,
+        max_retries=Retry(total=3, backoff_factor=0.1),
+    )
+    with requests.Session() as s:
+        s.mount("http://", adapter)
+        s.mount("https://", adapter)
+        yield s
+
+
 @pytest.fixture(scope="session", autouse=True)
-def wait_for_api():
-    _wait_for_api()
+def wait_for_api(session):
+    _wait_for_api(session)
+
+
+@pytest.fixture(scope="session")
+def enqueued_job(session):
+    """Enqueue one object_detect job shared by tests that only read it.
+
+    Returns (job_id, payload, create response body). Tests depending on it are
+    skipped when the API does not accept the job.
+    """
+    payload = _object_detect_payload(external_id=f"ci-shared-{uuid.uuid4()}")
+    r = session.post(CREATE_JOB_URL, json=payload, headers=HEADERS_AUTH)
+    if r.status_code != 202:
+        pytest.skip("Could not enqueue job; skipping tests that need one")
+    created = r.json()
+    return created["job_id"], payload, created
 
 
 # ---------------------------------------------------------------------------
@@ -80,29 +131,43 @@ def wait_for_api():
 
 
 class TestHealth:
-    def test_health_returns_200(self):
-        r = requests.get(f"{BASE_URL}/health")
-        assert r.status_code == 200
+    @pytest.fixture(scope="class")
+    def health(self, session):
+        """A single /health response shared by every check in this class."""
+        return session.get(HEALTH_URL)
 
-    def test_health_status_field(self):
-        r = requests.get(f"{BASE_URL}/health")
-        data = r.json()
+    def test_health_returns_200(self, health):
+        assert health.status_code == 200
+
+    def test_health_status_field(self, health):
+        data = health.json()
         assert data["status"] in ("healthy", "unhealthy")
 
-    def test_health_when_redis_connected(self):
-        r = requests.get(f"{BASE_URL}/health")
-        data = r.json()
+    def test_health_when_redis_connected(self, health):
+        data = health.json()
         assert data["status"] == "healthy"
 
-    def test_health_contains_job_stats(self):
-        r = requests.get(f"{BASE_URL}/health")
-        data = r.json()
+    def test_health_contains_job_stats(self, health):
+        data = health.json()
         assert "job_stats" in data
         stats = data["job_stats"]
         for key in ("queued", "processing", "completed", "failed"):
             assert key in stats
             assert isinstance(stats[key], int)
 
+    def test_health_if_none_match_returns_304(self, session):
+        for _ in range(3):
+            etag = session.get(HEALTH_URL).headers["ETag"]
+            r = session.get(HEALTH_URL, headers={"If-None-Match": etag})
+            if r.status_code == 304:
+                break
+            # Jobs enqueued by other tests in between change the ETag
+            assert r.status_code == 200
+            assert r.headers["ETag"] != etag
+        assert r.status_code == 304
+        assert r.headers["ETag"] == etag
+        assert r.content == b""
+
 
 # ---------------------------------------------------------------------------
 # GET / (API docs)
@@ -110,8 +175,8 @@ class TestHealth:
 
 
 class TestDocs:
-    def test_docs_returns_200(self):
-        r = requests.get(f"{BASE_URL}/")
+    def test_docs_returns_200(self, session):
+        r = session.get(DOCS_URL)
         assert r.status_code == 200
 
 
@@ -123,21 +188,21 @@ class TestDocs:
 class TestCreateJobAuth:
     _valid_payload = _object_detect_payload()
 
-    def test_create_missing_api_key_returns_403(self):
-        r = requests.post(f"{BASE_URL}/job/create", json=self._valid_payload)
+    def test_create_missing_api_key_returns_403(self, session):
+        r = session.post(CREATE_JOB_URL, json=self._valid_payload)
         assert r.status_code == 403
 
-    def test_create_wrong_api_key_returns_401(self):
-        r = requests.post(
-            f"{BASE_URL}/job/create",
+    def test_create_wrong_api_key_returns_401(self, session):
+        r = session.post(
+            CREATE_JOB_URL,
             json=self._valid_payload,
             headers={"x-api-key": "wrong-key"},
         )
         assert r.status_code == 401
 
-    def test_create_valid_api_key_returns_202(self):
-        r = requests.post(
-            f"{BASE_URL}/job/create",
+    def test_create_valid_api_key_returns_202(self, session):
+        r = session.post(
+            CREATE_JOB_URL,
             json=self._valid_payload,
             headers=HEADERS_AUTH,
         )
@@ -150,40 +215,26 @@ class TestCreateJobAuth:
 
 
 class TestCreateJobValidation:
-    def test_missing_external_id_returns_422(self):
-        r = requests.post(
-            f"{BASE_URL}/job/create",
-            json={
-                "job_type": "object_detect",
-                "video_url": "http://example.com/v.mp4",
-            },
-            headers=HEADERS_AUTH,
-        )
-        assert r.status_code == 422
-
-    def test_missing_video_url_returns_422(self):
-        r = requests.post(
-            f"{BASE_URL}/job/create",
-            json={"job_type": "object_detect", "external_id": "ci-proj"},
-            headers=HEADERS_AUTH,
-        )
-        assert r.status_code == 422
-
-    def test_invalid_job_type_returns_422(self):
-        r = requests.post(
-            f"{BASE_URL}/job/create",
-            json={
+    @pytest.mark.parametrize(
+        "payload",
+        [
+            {"job_type": "object_detect", "video_url": "http://example.com/v.mp4"},
+            {"job_type": "object_detect", "external_id": "ci-proj"},
+            {
                 "job_type": "invalid_type",
                 "external_id": "ci-proj",
                 "video_url": "http://example.com/v.mp4",
             },
-            headers=HEADERS_AUTH,
-        )
+        ],
+        ids=["missing-external-id", "missing-video-url", "invalid-job-type"],
+    )
+    def test_incomplete_payload_returns_422(self, session, payload):
+        r = session.post(CREATE_JOB_URL, json=payload, headers=HEADERS_AUTH)
         assert r.status_code == 422
 
-    def test_object_detect_invalid_similarity_threshold_returns_422(self):
-        r = requests.post(
-            f"{BASE_URL}/job/create",
+    def test_object_detect_invalid_similarity_threshold_returns_422(self, session):
+        r = session.post(
+            CREATE_JOB_URL,
             json=_object_detect_payload(
                 external_id="ci-proj",
                 params={"similarity_threshold": 5.0},
@@ -192,9 +243,9 @@ class TestCreateJobValidation:
         )
         assert r.status_code == 422
 
-    def test_object_detect_invalid_analysis_fps_zero_returns_422(self):
-        r = requests.post(
-            f"{BASE_URL}/job/create",
+    def test_object_detect_invalid_analysis_fps_zero_returns_422(self, session):
+        r = session.post(
+            CREATE_JOB_URL,
             json=_object_detect_payload(
                 external_id="ci-proj",
                 params={"analysis_fps": 0},
@@ -203,9 +254,9 @@ class TestCreateJobValidation:
         )
         assert r.status_code == 422
 
-    def test_object_detect_invalid_analysis_fps_too_high_returns_422(self):
-        r = requests.post(
-            f"{BASE_URL}/job/create",
+    def test_object_detect_invalid_analysis_fps_too_high_returns_422(self, session):
+        r = session.post(
+            CREATE_JOB_URL,
             json=_object_detect_payload(
                 external_id="ci-proj",
                 params={"analysis_fps": 100},
@@ -214,9 +265,9 @@ class TestCreateJobValidation:
         )
         assert r.status_code == 422
 
-    def test_object_detect_valid_analysis_fps_accepted(self):
-        r = requests.post(
-            f"{BASE_URL}/job/create",
+    def test_object_detect_valid_analysis_fps_accepted(self, session):
+        r = session.post(
+            CREATE_JOB_URL,
             json=_object_detect_payload(
                 external_id="ci-fps-test",
                 params={"similarity_threshold": 0.5, "analysis_fps": 5},
@@ -225,9 +276,9 @@ class TestCreateJobValidation:
         )
         assert r.status_code in (202, 422)
 
-    def test_invalid_video_url_returns_422(self):
-        r = requests.post(
-            f"{BASE_URL}/job/create",
+    def test_invalid_video_url_returns_422(self, session):
+        r = session.post(
+            CREATE_JOB_URL,
             json=_object_detect_payload(
                 external_id="ci-proj",
                 video_url="not-a-url-and-not-a-file",
@@ -236,53 +287,30 @@ class TestCreateJobValidation:
         )
         assert r.status_code == 422
 
-    def test_invalid_callback_url_scheme_returns_422(self):
-        r = requests.post(
-            f"{BASE_URL}/job/create",
-            json=_object_detect_payload(
-                external_id="ci-proj",
-                callback_url="ftp://example.com/callback",
-            ),
-            headers=HEADERS_AUTH,
-        )
-        assert r.status_code == 422
-
-    def test_callback_url_localhost_returns_422(self):
-        r = requests.post(
-            f"{BASE_URL}/job/create",
+    @pytest.mark.parametrize(
+        "callback_url",
+        [
+            "ftp://example.com/callback",
+            "http://localhost/callback",
+            "http://192.168.1.1/callback",
+            "http://127.0.0.1/callback",
+        ],
+        ids=["scheme", "localhost", "private-ip", "loopback"],
+    )
+    def test_rejected_callback_url_returns_422(self, session, callback_url):
+        r = session.post(
+            CREATE_JOB_URL,
             json=_object_detect_payload(
                 external_id="ci-proj",
-                callback_url="http://localhost/callback",
+                callback_url=callback_url,
             ),
             headers=HEADERS_AUTH,
         )
         assert r.status_code == 422
 
-    def test_callback_url_private_ip_returns_422(self):
-        r = requests.post(
-            f"{BASE_URL}/job/create",
-            json=_object_detect_payload(
-                external_id="ci-proj",
-                callback_url="http://192.168.1.1/callback",
-            ),
-            headers=HEADERS_AUTH,
-        )
-        assert r.status_code == 422
-
-    def test_callback_url_loopback_ip_returns_422(self):
-        r = requests.post(
-            f"{BASE_URL}/job/create",
-            json=_object_detect_payload(
-                external_id="ci-proj",
-                callback_url="http://127.0.0.1/callback",
-            ),
-            headers=HEADERS_AUTH,
-        )
-        assert r.status_code == 422
-
-    def test_valid_callback_url_accepted(self):
-        r = requests.post(
-            f"{BASE_URL}/job/create",
+    def test_valid_callback_url_accepted(self, session):
+        r = session.post(
+            CREATE_JOB_URL,
             json=_object_detect_payload(
                 external_id="ci-callback-valid",
                 callback_url="https://hooks.example.com/notify",
@@ -293,23 +321,17 @@ class TestCreateJobValidation:
         if r.status_code == 202:
             assert r.json().get("callback_url") == "https://hooks.example.com/notify"
 
-    def test_object_detect_response_shape(self):
-        r = requests.post(
-            f"{BASE_URL}/job/create",
-            json=_object_detect_payload(external_id="ci-shape-od"),
-            headers=HEADERS_AUTH,
-        )
-        if r.status_code == 202:
-            data = r.json()
-            assert data["job_type"] == "object_detect"
-            assert "job_id" in data
-            assert "status" in data
-            assert "queue_position" in data
-            assert "message" in data
+    def test_object_detect_response_shape(self, enqueued_job):
+        _, _, data = enqueued_job
+        assert data["job_type"] == "object_detect"
+        assert "job_id" in data
+        assert "status" in data
+        assert "queue_position" in data
+        assert "message" in data
 
-    def test_scene_detect_response_shape(self):
-        r = requests.post(
-            f"{BASE_URL}/job/create",
+    def test_scene_detect_response_shape(self, session):
+        r = session.post(
+            CREATE_JOB_URL,
             json=_scene_detect_payload(external_id="ci-shape-sd"),
             headers=HEADERS_AUTH,
         )
@@ -319,10 +341,10 @@ class TestCreateJobValidation:
             assert "job_id" in data
             assert "status" in data
 
-    def test_scene_detect_default_params(self):
+    def test_scene_detect_default_params(self, session):
         """scene_detect works without explicit params (defaults applied)."""
-        r = requests.post(
-            f"{BASE_URL}/job/create",
+        r = session.post(
+            CREATE_JOB_URL,
             json={
                 "job_type": "scene_detect",
                 "external_id": "ci-scene-defaults",
@@ -339,34 +361,26 @@ class TestCreateJobValidation:
 
 
 class TestJobStatusAuth:
-    def test_status_missing_api_key_returns_403(self):
-        r = requests.get(f"{BASE_URL}/status/{FAKE_JOB_ID}")
+    def test_status_missing_api_key_returns_403(self, session):
+        r = session.get(FAKE_STATUS_URL)
         assert r.status_code == 403
 
-    def test_status_wrong_api_key_returns_401(self):
-        r = requests.get(
-            f"{BASE_URL}/status/{FAKE_JOB_ID}",
+    def test_status_wrong_api_key_returns_401(self, session):
+        r = session.get(
+            FAKE_STATUS_URL,
             headers={"x-api-key": "wrong-key"},
         )
         assert r.status_code == 401
 
 
 class TestJobStatus:
-    def test_status_nonexistent_job_returns_404(self):
-        r = requests.get(f"{BASE_URL}/status/{FAKE_JOB_ID}", headers=HEADERS_AUTH)
+    def test_status_nonexistent_job_returns_404(self, session):
+        r = session.get(FAKE_STATUS_URL, headers=HEADERS_AUTH)
         assert r.status_code == 404
 
-    def test_status_returns_correct_shape(self):
-        r = requests.post(
-            f"{BASE_URL}/job/create",
-            json=_object_detect_payload(external_id="ci-status-test"),
-            headers=HEADERS_AUTH,
-        )
-        if r.status_code != 202:
-            pytest.skip("Could not enqueue job; skipping status shape test")
-
-        job_id = r.json()["job_id"]
-        rs = requests.get(f"{BASE_URL}/status/{job_id}", headers=HEADERS_AUTH)
+    def test_status_returns_correct_shape(self, session, enqueued_job):
+        job_id, _, _ = enqueued_job
+        rs = session.get(f"{STATUS_URL}/{job_id}", headers=HEADERS_AUTH)
         assert rs.status_code == 200
         data = rs.json()
         assert data["job_id"] == job_id
@@ -377,55 +391,80 @@ class TestJobStatus:
         assert "estimated_wait_time" in data
         assert "job_type" in data
 
-    def test_status_duplicate_project_returns_existing_job(self):
-        payload = _object_detect_payload(external_id="ci-dedup-test")
-        r1 = requests.post(f"{BASE_URL}/job/create", json=payload, headers=HEADERS_AUTH)
+    def test_status_duplicate_project_returns_existing_job(self, session):
+        # Its own back-to-back pair: the shared job may have finished already
+        payload = _object_detect_payload(external_id=f"ci-dedup-{uuid.uuid4()}")
+        r1 = session.post(CREATE_JOB_URL, json=payload, headers=HEADERS_AUTH)
         if r1.status_code != 202:
             pytest.skip("Could not enqueue job; skipping deduplication test")
         job_id_1 = r1.json()["job_id"]
 
-        r2 = requests.post(f"{BASE_URL}/job/create", json=payload, headers=HEADERS_AUTH)
+        r2 = session.post(CREATE_JOB_URL, json=payload, headers=HEADERS_AUTH)
         assert r2.status_code == 202
         assert r2.json()["job_id"] == job_id_1
 
 
+# ---------------------------------------------------------------------------
+# GET /status?ids=<id>,<id>
+# ---------------------------------------------------------------------------
+
+
+class TestJobsStatus:
+    def test_bulk_status_missing_api_key_returns_403(self, session):
+        r = session.get(STATUS_URL, params={"ids": FAKE_JOB_ID})
+        assert r.status_code == 403
+
+    def test_bulk_status_missing_ids_returns_422(self, session):
+        r = session.get(STATUS_URL, headers=HEADERS_AUTH)
+        assert r.status_code == 422
+
+    def test_bulk_status_omits_unknown_jobs(self, session):
+        r = session.get(STATUS_URL, params={"ids": FAKE_JOB_ID}, headers=HEADERS_AUTH)
+        assert r.status_code == 200
+        assert r.json() == []
+
+    def test_bulk_status_returns_enqueued_jobs(self, session, enqueued_job):
+        job_id, _, _ = enqueued_job
+        rs = session.get(
+            STATUS_URL,
+            params={"ids": f"{job_id},{FAKE_JOB_ID}"},
+            headers=HEADERS_AUTH,
+        )
+        assert rs.status_code == 200
+        data = rs.json()
+        assert [job["job_id"] for job in data] == [job_id]
+        assert data[0]["status"] in ("queued", "processing", "completed", "failed")
+
+
 # ---------------------------------------------------------------------------
 # GET /job/{job_id}/results
 # ---------------------------------------------------------------------------
 
 
 class TestJobResultsAuth:
-    def test_results_missing_api_key_returns_403(self):
-        r = requests.get(f"{BASE_URL}/job/{FAKE_JOB_ID}/results")
+    def test_results_missing_api_key_returns_403(self, session):
+        r = session.get(FAKE_RESULTS_URL)
         assert r.status_code == 403
 
-    def test_results_wrong_api_key_returns_401(self):
-        r = requests.get(
-            f"{BASE_URL}/job/{FAKE_JOB_ID}/results",
+    def test_results_wrong_api_key_returns_401(self, session):
+        r = session.get(
+            FAKE_RESULTS_URL,
             headers={"x-api-key": "wrong-key"},
         )
         assert r.status_code == 401
 
 
 class TestJobResults:
-    def test_results_nonexistent_job_returns_not_found_status(self):
-        r = requests.get(f"{BASE_URL}/job/{FAKE_JOB_ID}/results", headers=HEADERS_AUTH)
+    def test_results_nonexistent_job_returns_not_found_status(self, session):
+        r = session.get(FAKE_RESULTS_URL, headers=HEADERS_AUTH)
         assert r.status_code == 200
         data = r.json()
         assert data["status"] == "not-found"
         assert data["data"] is None
 
-    def test_results_response_has_status_and_data_fields(self):
-        r = requests.post(
-            f"{BASE_URL}/job/create",
-            json=_object_detect_payload(external_id="ci-results-shape"),
-            headers=HEADERS_AUTH,
-        )
-        if r.status_code != 202:
-            pytest.skip("Could not enqueue job; skipping results shape test")
-
-        job_id = r.json()["job_id"]
-        rr = requests.get(f"{BASE_URL}/job/{job_id}/results", headers=HEADERS_AUTH)
+    def test_results_response_has_status_and_data_fields(self, session, enqueued_job):
+        job_id, _, _ = enqueued_job
+        rr = session.get(f"{BASE_URL}/job/{job_id}/results", headers=HEADERS_AUTH)
         assert rr.status_code == 200
         data = rr.json()
         assert "status" in data
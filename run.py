@@ -20,9 +20,13 @@ logging.basicConfig(level=get_log_level())
 logger = logging.getLogger(__name__)
 
 
+# Signals the supervisor sleeps on: a stop request or a child exiting
+SUPERVISOR_SIGNALS = {signal.SIGINT, signal.SIGTERM, signal.SIGCHLD}
+
+
 def api_command() -> list[str]:
     log_level = os.getenv("LOG_LEVEL", "info").lower()
-    return [
+    command = [
         sys.executable,
         "-m",
         "uvicorn",
@@ -31,15 +35,21 @@ def api_command() -> list[str]:
         "0.0.0.0",
         "--port",
         "8081",
-        "--reload",
         "--log-level",
         log_level,
     ]
+    # The reloader runs a single worker, so it is opt-in for development
+    if os.getenv("UVICORN_RELOAD", "0") == "1":
+        return command + ["--reload"]
+    workers = os.getenv("UVICORN_WORKERS") or str(os.cpu_count() or 2)
+    return command + ["--workers", workers]
 
 
 def worker_command() -> list[str]:
     log_level = os.getenv("LOG_LEVEL", "info").lower()
     queue = os.getenv("CELERY_QUEUE_NAME", "celluloid_video_processing")
+    # Detection jobs are CPU-bound and independent: one forked process per core
+    concurrency = os.getenv("CELERY_CONCURRENCY") or str(os.cpu_count() or 1)
     return [
         sys.executable,
         "-m",
@@ -50,7 +60,8 @@ def worker_command() -> list[str]:
         "--loglevel",
         log_level,
         f"--queues={queue}",
-        "--concurrency=1",
+        "--pool=prefork",
+        f"--concurrency={concurrency}",
     ]
 
 
@@ -84,16 +95,15 @@ def shutdown_processes(processes: dict[str, subprocess.Popen]) -> None:
             logger.info("Stopping %s (pid=%s)...", name, proc.pid)
             proc.terminate()
 
-    deadline = time.time() + 10
-    while time.time() < deadline:
-        if all(proc.poll() is not None for proc in processes.values()):
-            return
-        time.sleep(0.2)
-
+    # Block on each child in turn; they all share one 10 s grace period
+    deadline = time.monotonic() + 10
     for name, proc in processes.items():
-        if proc.poll() is None:
+        try:
+            proc.wait(timeout=max(deadline - time.monotonic(), 0))
+        except subprocess.TimeoutExpired:
             logger.warning("%s did not stop gracefully, killing it.", name)
             proc.kill()
+            proc.wait()
 
 
 def run_multi(modes: list[str]) -> int:
@@ -116,17 +126,29 @@ def run_multi(modes: list[str]) -> int:
 
     try:
         for mode in modes:
+            if stop_requested:
+                break
             logger.info("Starting %s...", mode)
             processes[mode] = subprocess.Popen(commands[mode])
 
-        while not stop_requested:
-            for mode, proc in processes.items():
-                code = proc.poll()
-                if code is not None:
-                    logger.error("%s exited with code %s", mode, code)
-                    stop_requested = True
+        # Children are started first so they do not inherit the blocked mask.
+        # Blocked signals stay pending and are taken by sigwait, so nothing is
+        # missed between the checks below and going to sleep.
+        signal.pthread_sigmask(signal.SIG_BLOCK, SUPERVISOR_SIGNALS)
+        try:
+            while not stop_requested:
+                exited = [m for m, p in processes.items() if p.poll() is not None]
+                if exited:
+                    for mode in exited:
+                        code = processes[mode].returncode
+                        logger.error("%s exited with code %s", mode, code)
                     break
-            time.sleep(0.5)
+                signum = signal.sigwait(SUPERVISOR_SIGNALS)
+                if signum != signal.SIGCHLD:
+                    logger.info("Received signal %s, shutting down...", signum)
+                    stop_requested = True
+        finally:
+            signal.pthread_sigmask(signal.SIG_UNBLOCK, SUPERVISOR_SIGNALS)
     finally:
         shutdown_processes(processes)
 
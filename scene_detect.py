@@ -4,7 +4,9 @@ Command-line interface for video detection
 This is a wrapper script that calls the detection module from the app package.
 """
 import sys
-from app.detection.scene_detect import main
 
 if __name__ == "__main__":
+    # Imported here so that importing this module stays cheap
+    from app.detection.scene_detect import main
+
     sys.exit(main())